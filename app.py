@@ -4,14 +4,33 @@ The Office BALLS Simulator - Web Interface
 Simple Flask app for demonstrating BALLS-powered Office dynamics
 """
 
-from flask import Flask, render_template, request, jsonify
-import json
-from office_meeting_simulator import OfficeMeetingSimulator
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+import os
+from meeting_encoding import COMPACT_MIMETYPE, compact_meeting_response, wants_compact
+from meeting_service import (
+    DEMO_TOPICS, SPHERE_CONFIG, new_simulator, parse_seed, pooled_meeting_result, refresh_spheres, sse
+)
 
 app = Flask(__name__)
 
-# Global simulator instance
-simulator = OfficeMeetingSimulator()
+# Shared simulator; per-meeting state lives in a MeetingSession per request
+simulator = new_simulator()
+
+@app.before_request
+def check_sphere_config():
+    refresh_spheres(simulator)
+
+# Set MEETING_PROCESSES=N to run /api/start_meeting on N worker processes
+MEETING_PROCESSES = int(os.environ.get('MEETING_PROCESSES', 0))
+_meeting_pool = None
+
+def get_meeting_pool():
+    """Worker process pool, started on first use so the reloader doesn't fork twice"""
+    global _meeting_pool
+    if _meeting_pool is None and MEETING_PROCESSES > 0:
+        from meeting_workers import MeetingProcessPool
+        _meeting_pool = MeetingProcessPool(MEETING_PROCESSES, sphere_config=SPHERE_CONFIG)
+    return _meeting_pool
 
 @app.route('/')
 def index():
@@ -20,35 +39,70 @@ def index():
 
 @app.route('/api/start_meeting', methods=['POST'])
 def start_meeting():
-    """API endpoint to start a new Office meeting"""
+    """
+    API endpoint to start a new Office meeting
+    Send Accept: COMPACT_MIMETYPE (or ?format=compact) for the compact encoding
+    """
     data = request.get_json()
     topic = data.get('topic', 'General office discussion')
     max_turns = data.get('max_turns', 10)
+    try:
+        seed = parse_seed(data.get('seed'))
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
+    compact = wants_compact(request.headers.get('Accept'), request.args.get('format'))
+    
+    meeting_pool = get_meeting_pool()
+    if meeting_pool is not None and seed is None and not compact:
+        # Workers hand back ready-to-send JSON
+        result = meeting_pool.run_meeting(topic, max_turns)
+        return Response(result, mimetype='application/json')
     
-    # Run the meeting simulation
-    meeting_log = simulator.start_meeting(topic, max_turns)
-    analytics = simulator.analyze_meeting_dynamics()
+    if meeting_pool is not None:
+        result = pooled_meeting_result(meeting_pool, simulator, topic, max_turns, seed)
+    else:
+        # Run the meeting simulation (or replay a cached seeded one)
+        result = simulator.meeting_result(topic, max_turns, seed, columnar=True)
+    
+    if compact:
+        body, headers = compact_meeting_response(result, request.headers.get('Accept-Encoding'))
+        return Response(body, mimetype=COMPACT_MIMETYPE, headers=headers)
     
     return jsonify({
-        'meeting_log': meeting_log,
-        'analytics': analytics,
+        'meeting_log': result['meeting_log'].to_dicts(),
+        'analytics': result['analytics'],
         'success': True
     })
 
+@app.route('/api/stream_meeting')
+def stream_meeting():
+    """Server-sent events version of /api/start_meeting, one event per turn"""
+    topic = request.args.get('topic', 'General office discussion')
+    max_turns = request.args.get('max_turns', 10, type=int)
+    try:
+        # Raw string, so ?seed=abc is rejected rather than read as no seed
+        seed = request.args.get('seed')
+        seed = parse_seed(None if seed is None else int(seed))
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
+    
+    def generate():
+        session = simulator.new_session(topic, max_turns, seed)
+        for event in simulator.stream_meeting(topic, max_turns, session):
+            if event['event'] == 'turn':
+                yield sse('turn', event['entry'])
+        yield sse('analytics', session.analytics.snapshot())
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/demo_topics')
 def demo_topics():
     """Get suggested demo topics"""
-    topics = [
-        "We need to discuss the new sales targets",
-        "There's been an HR complaint about workplace behavior", 
-        "Someone has been stealing lunches from the refrigerator",
-        "We need to plan the office party",
-        "There are rumors about corporate layoffs",
-        "I think we need better security measures",
-        "The printer is broken again",
-        "We should discuss work-from-home policies"
-    ]
-    return jsonify(topics)
+    return jsonify(DEMO_TOPICS)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+The Office BALLS Simulator - Async Web Interface
+ASGI (Quart) serving mode with the same routes as app.py
+
+Requests are multiplexed on one event loop while meetings run on a pool of
+worker processes, so a slow client or a long meeting never holds up the
+others and simulations use every core. Streamed meetings run on threads,
+which only need to hand turns back to the loop as they happen.
+Run with: hypercorn asgi_app:app --bind 0.0.0.0:5000
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional
+
+from quart import Quart, Response, jsonify, render_template, request
+
+from meeting_encoding import COMPACT_MIMETYPE, compact_meeting_response, wants_compact
+from meeting_service import (
+    DEMO_TOPICS, SPHERE_CONFIG, new_simulator, parse_seed, pooled_meeting_result, refresh_spheres, sse
+)
+from meeting_workers import MeetingProcessPool
+
+app = Quart(__name__)
+
+# Worker processes for CPU-bound simulation; the threads wait on them and
+# drive streamed meetings, which the GIL keeps to one simulation at a time
+MEETING_WORKERS = int(os.environ.get('MEETING_WORKERS', os.cpu_count() or 4))
+executor = ThreadPoolExecutor(max_workers=MEETING_WORKERS, thread_name_prefix="meeting")
+_meeting_pool: Optional[MeetingProcessPool] = None
+
+def get_meeting_pool() -> MeetingProcessPool:
+    """Worker process pool, started on first use so importing the app doesn't fork"""
+    global _meeting_pool
+    if _meeting_pool is None:
+        _meeting_pool = MeetingProcessPool(MEETING_WORKERS, sphere_config=SPHERE_CONFIG)
+    return _meeting_pool
+
+@app.after_serving
+async def close_meeting_pool():
+    if _meeting_pool is not None:
+        _meeting_pool.close()
+
+# Shared simulator; per-meeting state lives in a MeetingSession per request
+simulator = new_simulator()
+
+@app.before_request
+async def check_sphere_config():
+    refresh_spheres(simulator)
+
+def _stream_meeting(topic: str, max_turns: int, seed: Optional[int]) -> Iterator[Dict]:
+    session = simulator.new_session(topic, max_turns, seed)
+    for event in simulator.stream_meeting(topic, max_turns, session):
+        if event['event'] == 'turn':
+            yield event
+    yield {'event': 'analytics', 'analytics': session.analytics.snapshot()}
+
+async def _iterate_in_worker(factory: Callable[[], Iterator[Dict]]) -> AsyncIterator[Dict]:
+    """Drive a blocking generator on a worker thread, handing items to the event loop"""
+    loop = asyncio.get_running_loop()
+    items = asyncio.Queue()
+    done = object()
+    
+    def produce():
+        try:
+            for item in factory():
+                loop.call_soon_threadsafe(items.put_nowait, item)
+        except Exception as e:
+            loop.call_soon_threadsafe(items.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(items.put_nowait, done)
+    
+    producer = loop.run_in_executor(executor, produce)
+    while True:
+        item = await items.get()
+        if item is done:
+            break
+        if isinstance(item, Exception):
+            raise item
+        yield item
+    await producer
+
+@app.route('/')
+async def index():
+    """Main interface for the Office meeting simulator"""
+    return await render_template('index.html')
+
+@app.route('/api/start_meeting', methods=['POST'])
+async def start_meeting():
+    """
+    API endpoint to start a new Office meeting
+    Send Accept: COMPACT_MIMETYPE (or ?format=compact) for the compact encoding
+    """
+    data = await request.get_json()
+    topic = data.get('topic', 'General office discussion')
+    max_turns = data.get('max_turns', 10)
+    try:
+        seed = parse_seed(data.get('seed'))
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
+    
+    compact = wants_compact(request.headers.get('Accept'), request.args.get('format'))
+    
+    meeting_pool = get_meeting_pool()
+    loop = asyncio.get_running_loop()
+    if seed is None and not compact:
+        # Workers hand back ready-to-send JSON
+        body = await loop.run_in_executor(executor, meeting_pool.run_meeting, topic, max_turns)
+        return Response(body, mimetype='application/json')
+    
+    result = await loop.run_in_executor(
+        executor, pooled_meeting_result, meeting_pool, simulator, topic, max_turns, seed
+    )
+    if compact:
+        body, headers = compact_meeting_response(result, request.headers.get('Accept-Encoding'))
+        return Response(body, mimetype=COMPACT_MIMETYPE, headers=headers)
+    
+    return jsonify({
+        'meeting_log': result['meeting_log'].to_dicts(),
+        'analytics': result['analytics'],
+        'success': True
+    })
+
+@app.route('/api/stream_meeting')
+async def stream_meeting():
+    """Server-sent events version of /api/start_meeting, one event per turn"""
+    topic = request.args.get('topic', 'General office discussion')
+    max_turns = request.args.get('max_turns', 10, type=int)
+    try:
+        # Raw string, so ?seed=abc is rejected rather than read as no seed
+        seed = request.args.get('seed')
+        seed = parse_seed(None if seed is None else int(seed))
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
+    
+    async def generate():
+        async for event in _iterate_in_worker(lambda: _stream_meeting(topic, max_turns, seed)):
+            if event['event'] == 'turn':
+                yield sse('turn', event['entry'])
+            else:
+                yield sse('analytics', event['analytics'])
+    
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.timeout = None
+    return response
+
+@app.route('/api/demo_topics')
+async def demo_topics():
+    """Get suggested demo topics"""
+    return jsonify(DEMO_TOPICS)
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)
@@ -8,10 +8,15 @@ dynamically resizes based on topic relevance and social dominance patterns.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional, Sequence, Union
+from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+import json
+import os
 import re
+import time
 
 class TopicType(Enum):
     MANAGEMENT = "management"
@@ -23,6 +28,10 @@ class TopicType(Enum):
     SALES = "sales"
     GENERAL = "general"
 
+# Fixed topic ordering used as the column axis of the engine's sphere matrices
+TOPIC_ORDER = list(TopicType)
+TOPIC_INDEX = {topic: i for i, topic in enumerate(TOPIC_ORDER)}
+
 @dataclass
 class CharacterSphere:
     """Represents a character's attention sphere in BALLS framework"""
@@ -31,21 +40,296 @@ class CharacterSphere:
     topic_modifiers: Dict[TopicType, float]  # Topic-specific multipliers
     dominance_factor: float  # How much this character dominates conversations
     repulsion_targets: List[str]  # Characters this sphere repels
+    attraction_targets: List[str] = field(default_factory=list)  # Characters this sphere draws out
+    repulsion_strength: float = 0.1  # Radius multiplier on repelled characters
+    attraction_strength: float = 1.5  # Radius multiplier on attracted characters
+    shielded_topics: List[TopicType] = field(default_factory=list)  # Topics where repulsion can't reach this sphere
     
-    def calculate_radius(self, topic: TopicType, context: Dict = None) -> float:
-        """Calculate dynamic sphere radius based on topic and context"""
+    def calculate_radius(self, topic: TopicType, context: Dict = None,
+                         registry: 'SphereRegistry' = None) -> float:
+        """
+        Calculate dynamic sphere radius based on topic and context
+        context['present'] lists who else is in the room; the legacy
+        'michael_present' key counts as Michael being there. Interactions
+        come from registry, the registry this sphere belongs to; it may only
+        be left out for the built-in CHARACTER_SPHERES
+        """
         modifier = self.topic_modifiers.get(topic, 1.0)
         
-        # Apply Michael's repulsion field for Toby - BUT NOT on HR topics (his domain)
-        if context and 'michael_present' in context and self.name == 'Toby':
-            if topic != TopicType.HR:  # Toby gets to shine on HR topics despite Michael
-                modifier *= 0.1
+        if context:
+            present = list(context.get('present', ()))
+            # The meeting context can set both; Michael still counts once
+            if 'michael_present' in context and 'Michael' not in present:
+                present.append('Michael')
+            if registry is None:
+                if CHARACTER_SPHERES.get(self.name) is not self:
+                    raise ValueError(f"{self.name} is not a built-in sphere; pass the registry it belongs to")
+                registry = CHARACTER_SPHERES
+            modifier *= registry.interaction_multiplier(self.name, topic, present, self)
             
         return min(self.base_size * modifier, 1.0)  # Cap at 1.0
 
+class SparseInteractions(NamedTuple):
+    """Directed sphere interactions in coordinate form: one entry per (source, target) pair"""
+    sources: np.ndarray  # Registry index of the acting sphere
+    targets: np.ndarray  # Registry index of the affected sphere
+    multipliers: np.ndarray  # (entries x topics) radius multiplier on the target
+
+class CompiledSpheres(NamedTuple):
+    """Registry contents as arrays indexed by registry position"""
+    index: Dict[str, int]
+    base_size: np.ndarray  # (spheres,)
+    topic_modifiers: np.ndarray  # (spheres x topics)
+    dominance: np.ndarray  # (spheres,)
+    repulsion: SparseInteractions
+    attraction: SparseInteractions
+
+class SphereRegistry(Mapping):
+    """
+    Name -> CharacterSphere registry for any size of cast
+    Repulsion and attraction are kept as sparse interaction lists, so building
+    a roster costs one pass over the interactions instead of roster squared.
+    """
+    
+    def __init__(self, spheres: Iterable[CharacterSphere] = ()):
+        self._spheres: Dict[str, CharacterSphere] = {}
+        self._compiled: Optional[CompiledSpheres] = None
+        self._fingerprint: Optional[str] = None
+        for sphere in spheres:
+            self.register(sphere)
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'SphereRegistry':
+        """Build a validated registry from a {'spheres': [...]} config mapping"""
+        if not isinstance(config, dict) or not isinstance(config.get('spheres'), list):
+            raise SphereConfigError("config must be an object with a 'spheres' list")
+        
+        registry = cls(sphere_from_config(entry) for entry in config['spheres'])
+        if len(registry) != len(config['spheres']):
+            raise SphereConfigError("sphere names must be unique")
+        for sphere in registry.values():
+            unknown = set(sphere.repulsion_targets + sphere.attraction_targets) - set(registry)
+            if unknown:
+                raise SphereConfigError(f"{sphere.name}: unknown interaction targets {sorted(unknown)}")
+        return registry
+    
+    def to_config(self) -> Dict:
+        return {'spheres': [sphere_to_config(sphere) for sphere in self._spheres.values()]}
+    
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the configuration, e.g. for cache keys"""
+        if self._fingerprint is None:
+            encoded = json.dumps(self.to_config(), sort_keys=True).encode('utf-8')
+            self._fingerprint = hashlib.sha1(encoded).hexdigest()[:16]
+        return self._fingerprint
+    
+    def register(self, sphere: CharacterSphere):
+        """Add or replace a sphere"""
+        self._spheres[sphere.name] = sphere
+        self._compiled = self._fingerprint = None
+    
+    def unregister(self, name: str):
+        del self._spheres[name]
+        self._compiled = self._fingerprint = None
+    
+    def __getitem__(self, name: str) -> CharacterSphere:
+        return self._spheres[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spheres)
+    
+    def __len__(self) -> int:
+        return len(self._spheres)
+    
+    def radius(self, name: str, topic: TopicType, present: Iterable[str] = ()) -> float:
+        """Radius of a registered sphere with the given characters in the room"""
+        sphere = self._spheres[name]
+        modifier = sphere.topic_modifiers.get(topic, 1.0) * self.interaction_multiplier(name, topic, present)
+        return min(sphere.base_size * modifier, 1.0)
+    
+    def interaction_multiplier(self, name: str, topic: TopicType, present: Iterable[str],
+                               target: CharacterSphere = None) -> float:
+        """Combined repulsion/attraction multiplier on name's radius from the spheres present"""
+        if target is None:
+            target = self._spheres[name]
+        multiplier = 1.0
+        for source_name in present:
+            source = self._spheres.get(source_name)
+            if source is None or source_name == name:
+                continue
+            if name in source.repulsion_targets and topic not in target.shielded_topics:
+                multiplier *= source.repulsion_strength
+            if name in source.attraction_targets:
+                multiplier *= source.attraction_strength
+        return multiplier
+    
+    def compiled(self) -> CompiledSpheres:
+        """Array form of the registry, rebuilt only after it changes"""
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+    
+    def _compile(self) -> CompiledSpheres:
+        spheres = list(self._spheres.values())
+        index = {sphere.name: i for i, sphere in enumerate(spheres)}
+        topic_modifiers = np.array(
+            [[sphere.topic_modifiers.get(topic, 1.0) for topic in TOPIC_ORDER] for sphere in spheres]
+        ).reshape(len(spheres), len(TOPIC_ORDER))
+        
+        def interactions(targets_of, strength_of, shielded: bool) -> SparseInteractions:
+            sources, targets, multipliers = [], [], []
+            for sphere in spheres:
+                for target_name in targets_of(sphere):
+                    if target_name not in index or target_name == sphere.name:
+                        continue
+                    target = self._spheres[target_name]
+                    sources.append(index[sphere.name])
+                    targets.append(index[target_name])
+                    multipliers.append([
+                        1.0 if shielded and topic in target.shielded_topics else strength_of(sphere)
+                        for topic in TOPIC_ORDER
+                    ])
+            return SparseInteractions(
+                np.array(sources, dtype=np.intp),
+                np.array(targets, dtype=np.intp),
+                np.array(multipliers, dtype=float).reshape(len(sources), len(TOPIC_ORDER))
+            )
+        
+        return CompiledSpheres(
+            index=index,
+            base_size=np.array([sphere.base_size for sphere in spheres], dtype=float),
+            topic_modifiers=topic_modifiers,
+            dominance=np.array([sphere.dominance_factor for sphere in spheres], dtype=float),
+            repulsion=interactions(lambda s: s.repulsion_targets, lambda s: s.repulsion_strength, True),
+            attraction=interactions(lambda s: s.attraction_targets, lambda s: s.attraction_strength, False)
+        )
+
+class SphereConfigError(ValueError):
+    """A sphere configuration failed validation"""
+
+def _topic_from_config(name: str, value) -> TopicType:
+    try:
+        return TopicType(value)
+    except ValueError:
+        raise SphereConfigError(f"{name}: unknown topic {value!r}") from None
+
+def _number_from_config(name: str, key: str, value, low: float, high: float = None) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise SphereConfigError(f"{name}: {key} must be a number")
+    if value < low or (high is not None and value > high):
+        bounds = f"[{low}, {high}]" if high is not None else f">= {low}"
+        raise SphereConfigError(f"{name}: {key} must be in {bounds}, got {value}")
+    return float(value)
+
+def sphere_from_config(entry: Dict) -> CharacterSphere:
+    """Validate one config entry and turn it into a CharacterSphere"""
+    if not isinstance(entry, dict) or not isinstance(entry.get('name'), str):
+        raise SphereConfigError("every sphere needs a string 'name'")
+    name = entry['name']
+    unknown = set(entry) - _SPHERE_CONFIG_KEYS
+    if unknown:
+        raise SphereConfigError(f"{name}: unknown keys {sorted(unknown)}")
+    
+    def names(key: str) -> List[str]:
+        value = entry.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise SphereConfigError(f"{name}: {key} must be a list of names")
+        return list(value)
+    
+    modifiers = entry.get('topic_modifiers', {})
+    if not isinstance(modifiers, dict):
+        raise SphereConfigError(f"{name}: topic_modifiers must be an object")
+    
+    return CharacterSphere(
+        name=name,
+        base_size=_number_from_config(name, 'base_size', entry.get('base_size'), 0.0, 1.0),
+        topic_modifiers={
+            _topic_from_config(name, topic): _number_from_config(name, f"topic_modifiers.{topic}", value, 0.0)
+            for topic, value in modifiers.items()
+        },
+        dominance_factor=_number_from_config(name, 'dominance_factor', entry.get('dominance_factor'), 0.0, 1.0),
+        repulsion_targets=names('repulsion_targets'),
+        attraction_targets=names('attraction_targets'),
+        repulsion_strength=_number_from_config(name, 'repulsion_strength', entry.get('repulsion_strength', 0.1), 0.0),
+        attraction_strength=_number_from_config(name, 'attraction_strength', entry.get('attraction_strength', 1.5), 0.0),
+        shielded_topics=[_topic_from_config(name, topic) for topic in names('shielded_topics')]
+    )
+
+def sphere_to_config(sphere: CharacterSphere) -> Dict:
+    return {
+        'name': sphere.name,
+        'base_size': sphere.base_size,
+        'topic_modifiers': {topic.value: value for topic, value in sphere.topic_modifiers.items()},
+        'dominance_factor': sphere.dominance_factor,
+        'repulsion_targets': list(sphere.repulsion_targets),
+        'attraction_targets': list(sphere.attraction_targets),
+        'repulsion_strength': sphere.repulsion_strength,
+        'attraction_strength': sphere.attraction_strength,
+        'shielded_topics': [topic.value for topic in sphere.shielded_topics]
+    }
+
+_SPHERE_CONFIG_KEYS = set(sphere_to_config(CharacterSphere('', 0.0, {}, 0.0, [])))
+
+def load_sphere_config(path: str) -> SphereRegistry:
+    """Read and validate a JSON sphere config file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            config = json.load(f)
+        except ValueError as e:
+            raise SphereConfigError(f"{path}: {e}") from None
+    return SphereRegistry.from_config(config)
+
+class SphereConfigFile:
+    """
+    A sphere config file that can be re-read when it changes
+    poll() is one stat() call when nothing changed, so callers can check it
+    on every request
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp = self._read_stamp()
+        self._rejected_stamp = None
+        self.registry = load_sphere_config(path)
+    
+    def _read_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def poll(self, apply: Callable[[SphereRegistry], None] = None) -> Optional[SphereRegistry]:
+        """
+        The new registry if the file changed since the last load, else None
+        apply (e.g. a simulator's reload_spheres) is called with the new
+        registry first; if it raises SphereConfigError the new config is
+        rejected and registry stays the last good one
+        """
+        try:
+            stamp = self._read_stamp()
+        except OSError:
+            return None
+        if stamp == self._stamp or stamp == self._rejected_stamp:
+            return None
+        
+        try:
+            registry = load_sphere_config(self.path)
+            if apply is not None:
+                apply(registry)
+        except (OSError, SphereConfigError) as e:
+            # Keep serving the last good config; don't re-read this version
+            self._rejected_stamp = stamp
+            print(f"⚠️  Ignoring sphere config {self.path}: {e}")
+            return None
+        
+        self._stamp = stamp
+        self._rejected_stamp = None
+        self.registry = registry
+        print(f"🔄 Reloaded sphere config {self.path} ({registry.fingerprint})")
+        return registry
+
 # Character sphere definitions based on Office dynamics
-CHARACTER_SPHERES = {
-    'Michael': CharacterSphere(
+CHARACTER_SPHERES = SphereRegistry([
+    CharacterSphere(
         name='Michael',
         base_size=0.8,
         topic_modifiers={
@@ -60,7 +344,7 @@ CHARACTER_SPHERES = {
         repulsion_targets=['Toby']
     ),
     
-    'Dwight': CharacterSphere(
+    CharacterSphere(
         name='Dwight',
         base_size=0.6,
         topic_modifiers={
@@ -76,7 +360,7 @@ CHARACTER_SPHERES = {
         repulsion_targets=[]
     ),
     
-    'Creed': CharacterSphere(
+    CharacterSphere(
         name='Creed',
         base_size=0.4,
         topic_modifiers={
@@ -90,7 +374,7 @@ CHARACTER_SPHERES = {
         repulsion_targets=[]
     ),
     
-    'Erin': CharacterSphere(
+    CharacterSphere(
         name='Erin',
         base_size=0.2,
         topic_modifiers={
@@ -104,7 +388,7 @@ CHARACTER_SPHERES = {
         repulsion_targets=[]
     ),
     
-    'Toby': CharacterSphere(
+    CharacterSphere(
         name='Toby',
         base_size=0.15,
         topic_modifiers={
@@ -114,108 +398,208 @@ CHARACTER_SPHERES = {
             TopicType.GENERAL: 0.8      # Generally defeated
         },
         dominance_factor=0.3,           # Boosted for HR situations
-        repulsion_targets=[]
+        repulsion_targets=[],
+        shielded_topics=[TopicType.HR]  # Gets to shine on HR topics despite Michael
     )
-}
+])
+
+# Topic detection patterns, highest priority first
+TOPIC_KEYWORDS = [
+    (TopicType.MANAGEMENT, ['manage', 'boss', 'meeting', 'corporate', 'business']),
+    (TopicType.HR, ['hr', 'human resources', 'policy', 'complaint']),
+    (TopicType.BEETS, ['beet', 'farm', 'schrute']),
+    (TopicType.SURVIVAL, ['survive', 'bear', 'fight', 'weapons', 'attack']),
+    (TopicType.CONSPIRACY, ['conspiracy', 'government', 'secret', 'truth']),
+    (TopicType.CONFUSION, ['confused', 'don\'t understand', 'what', 'how']),
+]
+
+# Keyword -> priority, plus one alternation over every keyword. The lookahead
+# reports a match at every offset so overlapping keywords are never skipped,
+# and alternatives are ordered by priority for keywords sharing a start.
+# The leading character class lets the scanner skip offsets cheaply.
+_KEYWORD_PRIORITY = {}
+for _priority, (_topic, _keywords) in enumerate(TOPIC_KEYWORDS):
+    for _keyword in _keywords:
+        _KEYWORD_PRIORITY.setdefault(_keyword, _priority)
+_TOPIC_PATTERN = re.compile(
+    '(?=[' + re.escape(''.join(sorted({keyword[0] for keyword in _KEYWORD_PRIORITY}))) + '])'
+    '(?=(' + '|'.join(
+        re.escape(keyword) for keyword in sorted(_KEYWORD_PRIORITY, key=_KEYWORD_PRIORITY.get)
+    ) + '))'
+)
+
+def classify_topic(message: str) -> TopicType:
+    """Single-pass topic detection, first-match priority of TOPIC_KEYWORDS"""
+    best = len(TOPIC_KEYWORDS)
+    for match in _TOPIC_PATTERN.finditer(message.lower()):
+        priority = _KEYWORD_PRIORITY[match.group(1)]
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    
+    return TOPIC_KEYWORDS[best][0] if best < len(TOPIC_KEYWORDS) else TopicType.GENERAL
+
+def check_roster_coverage(spheres: SphereRegistry, characters: Sequence[str]):
+    """Raise SphereConfigError unless spheres defines every roster member"""
+    missing = [char for char in characters if char not in spheres]
+    if missing:
+        raise SphereConfigError(f"config has no spheres for roster members {missing}")
 
 class BALLSEngine:
     """
     The BALLS conversation orchestration engine
     Manages character sphere interactions and turn-taking
+
+    Sphere radii, influences and speaking probabilities are precomputed as
+    (characters x topics) matrices whenever the roster changes, so each turn
+    is a row lookup plus a masked renormalization.
     """
     
-    def __init__(self, characters: List[str] = None):
+    def __init__(self, characters: List[str] = None, seed=None, spheres: SphereRegistry = None):
+        # Any registry works, from the core five to a whole-branch cast
+        self._spheres = CHARACTER_SPHERES if spheres is None else spheres
         if characters is None:
-            characters = list(CHARACTER_SPHERES.keys())
+            characters = list(self._spheres.keys())
+        check_roster_coverage(self._spheres, characters)
         
         self.active_characters = characters
         self.conversation_history = []
+        # Accepts an int, SeedSequence or an existing Generator; None draws fresh entropy
+        self.rng = np.random.default_rng(seed)
+    
+    @property
+    def spheres(self) -> SphereRegistry:
+        return self._spheres
+    
+    @spheres.setter
+    def spheres(self, spheres: SphereRegistry):
+        """Swap in another configuration for the same roster, e.g. in a parameter sweep"""
+        check_roster_coverage(spheres, self._active_characters)
+        self._spheres = spheres
+        self._build_sphere_matrices()
+    
+    @property
+    def active_characters(self) -> List[str]:
+        return self._active_characters
+    
+    @active_characters.setter
+    def active_characters(self, characters: List[str]):
+        check_roster_coverage(self._spheres, characters)
+        self._active_characters = list(characters)
+        self._build_sphere_matrices()
+    
+    def _build_sphere_matrices(self):
+        """
+        Precompute radius, influence and probability matrices for the roster
+        Interactions are applied from the registry's sparse lists, so only
+        pairs that are both on the roster cost anything
+        """
+        characters = self._active_characters
+        compiled = self._spheres.compiled()
+        self.character_index = {char: i for i, char in enumerate(characters)}
+        self.michael_present = 'Michael' in self.character_index
+        
+        ids = np.array([compiled.index[char] for char in characters], dtype=np.intp)
+        position = np.full(len(compiled.index), -1, dtype=np.intp)
+        position[ids] = np.arange(len(ids))
+        
+        modifiers = compiled.topic_modifiers[ids]
+        interaction = np.ones_like(modifiers)
+        for edges in (compiled.repulsion, compiled.attraction):
+            sources, targets = position[edges.sources], position[edges.targets]
+            active = (sources >= 0) & (targets >= 0)
+            np.multiply.at(interaction, targets[active], edges.multipliers[active])
+        
+        base_size = compiled.base_size[ids, None]
+        self.dominance = compiled.dominance[ids]
+        # Display radius ignores interactions; influence folds them in
+        self.radius_matrix = np.minimum(base_size * modifiers, 1.0)
+        self.influence_matrix = np.minimum(base_size * (modifiers * interaction), 1.0) * self.dominance[:, None]
+        
+        totals = self.influence_matrix.sum(axis=0)
+        self.probability_matrix = np.divide(
+            self.influence_matrix, totals,
+            out=self.influence_matrix.copy(), where=totals > 0
+        )
+        # Per-topic cumulative rows (topics x characters) for O(log n) draws
+        self.cumulative_matrix = np.ascontiguousarray(np.cumsum(self.probability_matrix, axis=0).T)
         
     def analyze_topic(self, message: str) -> TopicType:
         """Analyze message content to determine topic type"""
-        message_lower = message.lower()
-        
-        # Topic detection patterns
-        if any(word in message_lower for word in ['manage', 'boss', 'meeting', 'corporate', 'business']):
-            return TopicType.MANAGEMENT
-        elif any(word in message_lower for word in ['hr', 'human resources', 'policy', 'complaint']):
-            return TopicType.HR
-        elif any(word in message_lower for word in ['beet', 'farm', 'schrute']):
-            return TopicType.BEETS
-        elif any(word in message_lower for word in ['survive', 'bear', 'fight', 'weapons', 'attack']):
-            return TopicType.SURVIVAL
-        elif any(word in message_lower for word in ['conspiracy', 'government', 'secret', 'truth']):
-            return TopicType.CONSPIRACY
-        elif any(word in message_lower for word in ['confused', 'don\'t understand', 'what', 'how']):
-            return TopicType.CONFUSION
-        else:
-            return TopicType.GENERAL
+        return classify_topic(message)
+    
+    def analyze_topics(self, messages: Sequence[str]) -> List[TopicType]:
+        """Batch topic analysis for whole transcripts"""
+        return [classify_topic(message) for message in messages]
     
     def calculate_speaking_probabilities(self, topic: TopicType, context: Dict = None) -> Dict[str, float]:
         """
         Calculate each character's probability of speaking next
         Based on sphere radius overlap and dominance factors
         """
-        if context is None:
-            context = {}
-            
-        # Add Michael presence context for Toby repulsion
-        if 'Michael' in self.active_characters:
-            context['michael_present'] = True
-            
-        probabilities = {}
-        total_influence = 0
-        
-        for character in self.active_characters:
-            sphere = CHARACTER_SPHERES[character]
-            
-            # Calculate effective sphere radius for this topic
-            radius = sphere.calculate_radius(topic, context)
-            
-            # Factor in dominance
-            influence = radius * sphere.dominance_factor
-            
-            probabilities[character] = influence
-            total_influence += influence
-        
-        # Normalize to probabilities
-        if total_influence > 0:
-            for character in probabilities:
-                probabilities[character] /= total_influence
+        if context and 'michael_present' in context and not self.michael_present:
+            # Caller forced Michael's repulsion field onto a roster without him
+            influences = np.array([
+                self.spheres.radius(char, topic, ['Michael']) * self.spheres[char].dominance_factor
+                for char in self._active_characters
+            ])
+            total = influences.sum()
+            probabilities = influences / total if total > 0 else influences
+        else:
+            probabilities = self.probability_matrix[:, TOPIC_INDEX[topic]]
         
-        return probabilities
+        return dict(zip(self._active_characters, probabilities.tolist()))
     
-    def select_next_speaker(self, message: str, exclude: List[str] = None) -> str:
-        """Select the next character to speak based on BALLS dynamics"""
-        topic = self.analyze_topic(message)
-        
-        if exclude is None:
-            exclude = []
-            
-        available_characters = [c for c in self.active_characters if c not in exclude]
-        
-        if not available_characters:
-            return np.random.choice(self.active_characters)
-        
-        probabilities = self.calculate_speaking_probabilities(topic)
+    def calculate_sphere_radii(self, topic: TopicType) -> Dict[str, float]:
+        """Context-free sphere radius of each active character for a topic"""
+        return dict(zip(self._active_characters, self.radius_matrix[:, TOPIC_INDEX[topic]].tolist()))
+    
+    def select_next_speaker_index(self, topic: TopicType, exclude: List[int] = None,
+                                  rng: np.random.Generator = None) -> int:
+        """
+        Select the next speaker's roster index for an already analyzed topic
+        Draws from rng when given (e.g. one stream per meeting), else the engine's own
+        """
+        if rng is None:
+            rng = self.rng
+        n = len(self._active_characters)
+        cumulative = self.cumulative_matrix[TOPIC_INDEX[topic]]
+        excluded = sorted(set(exclude)) if exclude else []
         
-        # Filter to available characters and renormalize
-        filtered_probs = {c: probabilities[c] for c in available_characters}
-        total = sum(filtered_probs.values())
+        if len(excluded) >= n:
+            return int(rng.integers(n))
         
-        if total > 0:
-            for c in filtered_probs:
-                filtered_probs[c] /= total
-        else:
+        # Sample the full cumulative row, stepping over excluded intervals,
+        # so a turn costs O(log n + excluded) rather than a pass over the roster
+        starts = [cumulative[i - 1] if i else 0.0 for i in excluded]
+        widths = [cumulative[i] - start for i, start in zip(excluded, starts)]
+        total = cumulative[-1] - sum(widths)
+        if total <= 0:
             # Equal probability fallback
-            uniform_prob = 1.0 / len(available_characters)
-            filtered_probs = {c: uniform_prob for c in available_characters}
+            available = np.setdiff1d(np.arange(n), excluded)
+            return int(available[int(rng.random() * len(available))])
+        
+        target = rng.random() * total
+        for start, width in zip(starts, widths):
+            if target < start:
+                break
+            target += width
         
-        # Select based on probabilities
-        characters = list(filtered_probs.keys())
-        probs = list(filtered_probs.values())
+        index = min(int(np.searchsorted(cumulative, target, side='right')), n - 1)
+        if index in excluded:
+            # Rounding left the target on an excluded edge; take the next one available
+            available = np.setdiff1d(np.arange(n), excluded)
+            index = int(available[min(np.searchsorted(available, index), len(available) - 1)])
+        return index
+    
+    def select_next_speaker(self, message: Union[str, TopicType], exclude: List[str] = None,
+                            rng: np.random.Generator = None) -> str:
+        """Select the next character to speak based on BALLS dynamics"""
+        topic = message if isinstance(message, TopicType) else self.analyze_topic(message)
         
-        return np.random.choice(characters, p=probs)
+        exclude_indices = [self.character_index[c] for c in exclude or [] if c in self.character_index]
+        return self._active_characters[self.select_next_speaker_index(topic, exclude_indices, rng)]
     
     def simulate_meeting_dynamics(self, initial_topic: str, turns: int = 10) -> List[Dict]:
         """Simulate a full Office meeting with BALLS dynamics"""
@@ -229,32 +613,103 @@ class BALLSEngine:
             'sphere_sizes': {}
         })
         
+        # Topic never drifts here, so the sphere row is fixed for the meeting
+        probabilities = self.calculate_speaking_probabilities(topic)
+        sphere_sizes = self.calculate_sphere_radii(topic)
+        
         last_speaker = None
         
         for turn in range(turns):
             # Select next speaker (avoid back-to-back unless dominant)
-            exclude = [last_speaker] if last_speaker and CHARACTER_SPHERES[last_speaker].dominance_factor < 0.8 else []
-            speaker = self.select_next_speaker(initial_topic, exclude)
-            
-            # Calculate current sphere sizes for visualization
-            probabilities = self.calculate_speaking_probabilities(topic)
-            sphere_sizes = {}
-            for char in self.active_characters:
-                sphere = CHARACTER_SPHERES[char]
-                sphere_sizes[char] = sphere.calculate_radius(topic)
+            exclude = [last_speaker] if last_speaker is not None and self.dominance[last_speaker] < 0.8 else []
+            speaker_index = self.select_next_speaker_index(topic, exclude)
+            speaker = self._active_characters[speaker_index]
             
             conversation.append({
                 'speaker': speaker,
                 'message': f"[{speaker} responds with sphere size {sphere_sizes[speaker]:.2f}]",
                 'topic': topic.value,
-                'sphere_sizes': sphere_sizes,
+                'sphere_sizes': dict(sphere_sizes),
                 'speaking_probability': probabilities[speaker]
             })
             
-            last_speaker = speaker
+            last_speaker = speaker_index
         
         return conversation
 
+    def simulate_meeting_batch(self, initial_topics: Union[str, Sequence[str]], n_meetings: int = 1,
+                               turns: int = 10, seeds: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Monte Carlo version of simulate_meeting_dynamics for many meetings at once
+        
+        Returns an (n_meetings, turns) array of indices into active_characters.
+        A list of topics runs one meeting per topic; per-meeting seeds make each
+        row reproducible on its own, independent of the rest of the batch.
+        """
+        if isinstance(initial_topics, str):
+            topic_ids = np.full(n_meetings, TOPIC_INDEX[self.analyze_topic(initial_topics)])
+        else:
+            topic_ids = np.array([TOPIC_INDEX[self.analyze_topic(t)] for t in initial_topics], dtype=np.intp)
+            n_meetings = len(topic_ids)
+        
+        if seeds is None:
+            draws = self.rng.random((n_meetings, turns))
+        else:
+            if len(seeds) != n_meetings:
+                raise ValueError(f"Expected {n_meetings} seeds, got {len(seeds)}")
+            draws = np.empty((n_meetings, turns))
+            for i, seed in enumerate(seeds):
+                draws[i] = np.random.default_rng(seed).random(turns)
+        
+        n = len(self._active_characters)
+        speakers = np.empty((n_meetings, turns), dtype=np.int8 if n <= 127 else np.int32)
+        if n == 0 or n_meetings == 0:
+            return speakers
+        
+        # Only the topics actually present get a cumulative row
+        unique_topics, topic_rows = np.unique(topic_ids, return_inverse=True)
+        probabilities = self.probability_matrix[:, unique_topics].T.copy()
+        # Equal probability fallback where every sphere is empty
+        probabilities[probabilities.sum(axis=1) <= 0] = 1.0
+        cumulative = np.zeros((len(unique_topics), n + 1))
+        np.cumsum(probabilities, axis=1, out=cumulative[:, 1:])
+        cumulative /= cumulative[:, -1:]
+        # Offset each topic row by its position so one searchsorted serves every meeting
+        flat = (cumulative[:, 1:] + np.arange(len(unique_topics))[:, None]).ravel()
+        blockable = self.dominance < 0.8 if n > 1 else np.zeros(n, dtype=bool)
+        
+        last = np.zeros(n_meetings, dtype=np.intp)
+        blocked = np.zeros(n_meetings, dtype=bool)  # Nobody has spoken yet
+        for turn in range(turns):
+            # Step the draw over the last speaker's interval when they can't go again
+            start = np.where(blocked, cumulative[topic_rows, last], 0.0)
+            width = np.where(blocked, cumulative[topic_rows, last + 1] - start, 0.0)
+            target = draws[:, turn] * (1.0 - width)
+            target += np.where(target >= start, width, 0.0)
+            
+            choice = np.searchsorted(flat, target + topic_rows, side='right') - topic_rows * n
+            np.clip(choice, 0, n - 1, out=choice)
+            
+            # Rounding can land on the blocked speaker's edge; take a neighbour
+            clash = blocked & (choice == last)
+            choice[clash] = np.where(last[clash] + 1 < n, last[clash] + 1, last[clash] - 1)
+            # The blocked speaker held all the weight: everyone else is equally likely
+            degenerate = blocked & (width >= 1.0)
+            if degenerate.any():
+                others = (draws[degenerate, turn] * (n - 1)).astype(np.intp)
+                choice[degenerate] = others + (others >= last[degenerate])
+            
+            speakers[:, turn] = choice
+            last = choice
+            blocked = blockable[choice]
+        
+        return speakers
+    
+    def speaker_distribution(self, speakers: np.ndarray) -> Dict[str, float]:
+        """Fraction of turns taken by each character in a batch of simulated meetings"""
+        counts = np.bincount(speakers.ravel(), minlength=len(self._active_characters))
+        return dict(zip(self._active_characters, (counts / max(counts.sum(), 1)).tolist()))
+
 def demo_balls_dynamics():
     """Demonstrate BALLS framework with different topics"""
     engine = BALLSEngine()
@@ -278,11 +733,58 @@ def demo_balls_dynamics():
         print("Speaking Probabilities:")
         
         for character, prob in sorted(probabilities.items(), key=lambda x: x[1], reverse=True):
-            sphere = CHARACTER_SPHERES[character]
-            radius = sphere.calculate_radius(topic_type)
+            radius = engine.spheres.radius(character, topic_type)
             print(f"  {character}: {prob:.3f} (radius: {radius:.2f})")
         
         print("-" * 50)
 
+def synthetic_registry(n_characters: int, interactions_per_character: int = 2, seed: int = 0) -> SphereRegistry:
+    """Random cast of n personas with a few repulsions/attractions each, for scaling tests"""
+    rng = np.random.default_rng(seed)
+    names = [f"Persona{i}" for i in range(n_characters)]
+    registry = SphereRegistry()
+    for name in names:
+        partners = rng.choice(names, size=min(2 * interactions_per_character, n_characters), replace=False)
+        registry.register(CharacterSphere(
+            name=name,
+            base_size=float(rng.uniform(0.1, 0.9)),
+            topic_modifiers={topic: float(rng.uniform(0.1, 3.0)) for topic in TOPIC_ORDER if rng.random() < 0.6},
+            dominance_factor=float(rng.uniform(0.1, 1.0)),
+            repulsion_targets=list(partners[:interactions_per_character]),
+            attraction_targets=list(partners[interactions_per_character:])
+        ))
+    return registry
+
+def benchmark_roster_scaling(sizes: Sequence[int] = (5, 50, 200, 500, 1000, 5000), turns: int = 2000):
+    """Print how roster build, per-turn selection and batch simulation scale with cast size"""
+    print("=== BALLS ROSTER SCALING ===\n")
+    print(f"{'roster':>7} {'build ms':>9} {'turn us':>8} {'batch turn us':>14}")
+    for size in sizes:
+        registry = synthetic_registry(size)
+        start = time.perf_counter()
+        engine = BALLSEngine(seed=0, spheres=registry)
+        build_ms = (time.perf_counter() - start) * 1e3
+        
+        topics = [TOPIC_ORDER[i % len(TOPIC_ORDER)] for i in range(turns)]
+        last = 0
+        start = time.perf_counter()
+        for topic in topics:
+            last = engine.select_next_speaker_index(topic, [last])
+        turn_us = (time.perf_counter() - start) / turns * 1e6
+        
+        start = time.perf_counter()
+        engine.simulate_meeting_batch("We need to discuss the new sales targets", n_meetings=1000, turns=50)
+        batch_us = (time.perf_counter() - start) / 50 * 1e6
+        
+        print(f"{size:>7} {build_ms:>9.2f} {turn_us:>8.1f} {batch_us:>14.1f}")
+
 if __name__ == "__main__":
-    demo_balls_dynamics()
\ No newline at end of file
+    import sys
+    if "--benchmark" in sys.argv:
+        benchmark_roster_scaling()
+    elif "--dump-config" in sys.argv:
+        # Starting point for a sphere config file: python balls_engine.py --dump-config spheres.json
+        with open(sys.argv[sys.argv.index("--dump-config") + 1], 'w', encoding='utf-8') as f:
+            json.dump(CHARACTER_SPHERES.to_config(), f, indent=2)
+    else:
+        demo_balls_dynamics()
\ No newline at end of file
@@ -2,28 +2,41 @@
 """
 Format Office character data for AutoTrain
 Creates conversation-style training data for each character
+
+Re-runs only reformat characters whose training files changed since the
+last run, or every character when the prompt templates in
+iter_autotrain_examples are edited (tracked in autotrain_manifest.json).
+Examples are generated lazily and streamed into the JSONL files, so no
+character's examples are ever held in memory as a list.
 """
 
+import argparse
+import inspect
 import os
 import json
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Sequence, Tuple
 
-def create_autotrain_format(character_lines: List[str], character_name: str) -> List[Dict]:
+from preprocess_office_data import training_files
+from stage_manifest import StageManifest, digest_files
+
+AUTOTRAIN_MANIFEST = 'autotrain_manifest.json'
+
+def iter_autotrain_examples(character_lines: Iterable[str], character_name: str) -> Iterator[Dict]:
     """
-    Convert character lines to AutoTrain conversation format
+    Convert character lines to AutoTrain conversation format, lazily
     Each line becomes a user prompt with character response
     """
-    training_examples = []
+    prev_line = None
     
-    for i, line in enumerate(character_lines):
+    for line in character_lines:
         # Extract the actual dialogue after "Character: "
-        if ': ' in line:
-            dialogue = line.split(': ', 1)[1]
-        else:
+        if ': ' not in line:
+            prev_line = line
             continue
+        dialogue = line.split(': ', 1)[1]
             
         # Create conversational training example
-        example = {
+        yield {
             "messages": [
                 {
                     "role": "user",
@@ -36,45 +49,74 @@ def create_autotrain_format(character_lines: List[str], character_name: str) ->
             ]
         }
         
-        training_examples.append(example)
-        
         # Also create contextual variations
-        if i > 0:
+        if prev_line is not None and ': ' in prev_line:
             # Previous line context
-            prev_line = character_lines[i-1]
-            if ': ' in prev_line:
-                prev_dialogue = prev_line.split(': ', 1)[1]
-                context_example = {
-                    "messages": [
-                        {
-                            "role": "user", 
-                            "content": f"In The Office, someone just said: '{prev_dialogue}'. How would {character_name} respond?"
-                        },
-                        {
-                            "role": "assistant",
-                            "content": dialogue
-                        }
-                    ]
-                }
-                training_examples.append(context_example)
-    
-    return training_examples
+            prev_dialogue = prev_line.split(': ', 1)[1]
+            yield {
+                "messages": [
+                    {
+                        "role": "user", 
+                        "content": f"In The Office, someone just said: '{prev_dialogue}'. How would {character_name} respond?"
+                    },
+                    {
+                        "role": "assistant",
+                        "content": dialogue
+                    }
+                ]
+            }
+        prev_line = line
+
+def create_autotrain_format(character_lines: List[str], character_name: str) -> List[Dict]:
+    """Convert character lines to AutoTrain conversation format"""
+    return list(iter_autotrain_examples(character_lines, character_name))
+
+def write_jsonl(path: str, records: Iterable[Dict], batch_size: int = 1024) -> int:
+    """
+    Write records one JSON object per line as they are produced; encoded
+    lines are joined and written in batches. Returns the number written.
+    """
+    encode = json.dumps
+    written = 0
+    batch = []
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for record in records:
+            batch.append(encode(record))
+            if len(batch) == batch_size:
+                f.write('\n'.join(batch) + '\n')
+                written += len(batch)
+                batch.clear()
+        if batch:
+            f.write('\n'.join(batch) + '\n')
+            written += len(batch)
+    return written
+
+def iter_training_lines(filepaths: Sequence[str]) -> Iterator[str]:
+    """One character's training lines, across all of its files in order"""
+    for filepath in filepaths:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+def read_training_lines(filepaths: Sequence[str]) -> List[str]:
+    return list(iter_training_lines(filepaths))
 
 def load_character_data(data_dir: str) -> Dict[str, List[str]]:
-    """Load all character training data"""
-    character_data = {}
-    
-    for filename in os.listdir(data_dir):
-        if filename.endswith('_training_data.txt'):
-            character = filename.replace('_training_data.txt', '').capitalize()
-            filepath = os.path.join(data_dir, filename)
-            
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
-            
-            character_data[character] = lines
-    
-    return character_data
+    """Load all character training data (single files or preprocessing shards)"""
+    return {
+        character: read_training_lines(filepaths)
+        for character, filepaths in training_files(data_dir).items()
+    }
+
+def autotrain_path(output_dir: str, character: str) -> str:
+    return f"{output_dir}/{character.lower()}_autotrain.jsonl"
+
+def save_character_autotrain(character: str, lines: Iterable[str], output_dir: str) -> Tuple[str, int]:
+    """Stream one character's lines into AutoTrain JSONL; returns (path, examples written)"""
+    output_file = autotrain_path(output_dir, character)
+    return output_file, write_jsonl(output_file, iter_autotrain_examples(lines, character))
 
 def save_autotrain_data(character_data: Dict[str, List[str]], output_dir: str):
     """Save data in AutoTrain format"""
@@ -82,26 +124,55 @@ def save_autotrain_data(character_data: Dict[str, List[str]], output_dir: str):
     
     for character, lines in character_data.items():
         print(f"Processing {character}...")
+        output_file, examples = save_character_autotrain(character, lines, output_dir)
+        print(f"Saved {examples} examples for {character} to {output_file}")
+
+def autotrain_manifest(output_dir: str) -> StageManifest:
+    """Build manifest for output_dir, keyed to the current prompt templates"""
+    return StageManifest(os.path.join(output_dir, AUTOTRAIN_MANIFEST), 'autotrain',
+                         {'templates': inspect.getsource(iter_autotrain_examples)})
+
+def update_autotrain_data(data_dir: str, output_dir: str, force: bool = False):
+    """
+    Save AutoTrain data for characters whose training files changed since
+    the last run, and remove the files of characters that are gone
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = autotrain_manifest(output_dir)
+    if force:
+        manifest.clear()
+    
+    character_files = training_files(data_dir)
+    for character, filepaths in character_files.items():
+        key = f"character:{character}"
+        inputs = digest_files(filepaths)
+        data = manifest.current(key, inputs)
+        if data is not None:
+            print(f"Unchanged: {data['examples']} examples for {character} in {autotrain_path(output_dir, character)}")
+            continue
         
-        # Create training examples
-        training_examples = create_autotrain_format(lines, character)
-        
-        # Save as JSONL for AutoTrain
-        output_file = f"{output_dir}/{character.lower()}_autotrain.jsonl"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for example in training_examples:
-                f.write(json.dumps(example) + '\n')
-        
-        print(f"Saved {len(training_examples)} examples for {character} to {output_file}")
+        print(f"Processing {character}...")
+        output_file, examples = save_character_autotrain(character, iter_training_lines(filepaths), output_dir)
+        manifest.record(key, inputs, [output_file], {'examples': examples})
+        print(f"Saved {examples} examples for {character} to {output_file}")
+    
+    # Characters the training data no longer has
+    for path in manifest.prune(f"character:{character}" for character in character_files):
+        print(f"Removed stale {path}")
+    manifest.save()
 
 def main():
-    print("Loading character training data...")
-    character_data = load_character_data('training_data')
+    parser = argparse.ArgumentParser(description="Format character training data for AutoTrain")
+    parser.add_argument("--data_dir", default="training_data")
+    parser.add_argument("--output_dir", default="autotrain_data")
+    parser.add_argument("--force", action="store_true", help="Ignore the build manifest and reformat everything")
+    args = parser.parse_args()
     
-    print(f"Found characters: {list(character_data.keys())}")
+    print("Loading character training data...")
+    print(f"Found characters: {list(training_files(args.data_dir).keys())}")
     
     print("\nFormatting for AutoTrain...")
-    save_autotrain_data(character_data, 'autotrain_data')
+    update_autotrain_data(args.data_dir, args.output_dir, args.force)
     
     print("\n=== AUTOTRAIN FORMATTING COMPLETE ===")
     print("Ready for LoRA training!")
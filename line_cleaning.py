@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Training line cleaning pipeline
+Turns raw transcript lines into training text through a chain of stages
+
+A stage takes one line and returns the cleaned line, or None (or '') to drop
+it. Patterns are compiled once at import, and stateful stages such as dedup
+get fresh state per output stream via CleaningPipeline.cleaner(), so one
+configured pipeline can feed many per-character files line by line.
+"""
+
+import copy
+import random
+import re
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+Stage = Callable[[str], Optional[str]]
+
+STAGE_DIRECTIONS = re.compile(r'\[.*?\]')
+
+def strip_line(line: str) -> str:
+    return line.strip()
+
+def strip_stage_directions(line: str) -> str:
+    """Remove bracketed stage directions like [laughs]"""
+    return STAGE_DIRECTIONS.sub('', line) if '[' in line else line
+
+def normalize_whitespace(line: str) -> str:
+    """Collapse runs of whitespace (tabs, double spaces) to single spaces and trim"""
+    # split/join is ~4x faster than a compiled \s+ substitution here
+    return ' '.join(line.split())
+
+class LengthFilter:
+    """Drop lines shorter than min_chars or longer than max_chars"""
+
+    def __init__(self, min_chars: int = 1, max_chars: Optional[int] = None):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+
+    def __call__(self, line: str) -> Optional[str]:
+        if len(line) < self.min_chars or (self.max_chars is not None and len(line) > self.max_chars):
+            return None
+        return line
+
+    def __repr__(self) -> str:
+        return f"LengthFilter(min_chars={self.min_chars}, max_chars={self.max_chars})"
+
+class DedupFilter:
+    """Drop lines already seen in this stream"""
+
+    # Output depends on every earlier line of the stream, not just this one
+    spans_stream = True
+
+    def __init__(self):
+        self.seen = set()
+
+    def __call__(self, line: str) -> Optional[str]:
+        if line in self.seen:
+            return None
+        self.seen.add(line)
+        return line
+
+    def __repr__(self) -> str:
+        return "DedupFilter()"
+
+# What preprocessing has always done: trim, drop stage directions, trim again
+DEFAULT_STAGES = (strip_line, strip_stage_directions, strip_line)
+
+class CleaningPipeline:
+    """Ordered chain of cleaning stages"""
+
+    def __init__(self, stages: Sequence[Stage] = DEFAULT_STAGES):
+        self.stages = tuple(stages)
+
+    @property
+    def spans_stream(self) -> bool:
+        """True if a stage needs the whole stream in order (so it can't be split into shards)"""
+        return any(getattr(stage, 'spans_stream', False) for stage in self.stages)
+
+    def cleaner(self) -> 'CleaningPipeline':
+        """Copy with fresh stage state, for one output stream"""
+        return CleaningPipeline(copy.deepcopy(self.stages))
+
+    def clean_line(self, line: str) -> Optional[str]:
+        """Run one line through every stage; None if a stage drops it"""
+        for stage in self.stages:
+            line = stage(line)
+            if not line:
+                return None
+        return line
+
+    def clean(self, lines: Iterable[str]) -> Iterator[str]:
+        """Lazily clean a stream of lines, skipping dropped ones"""
+        clean_line = self.clean_line
+        for line in lines:
+            cleaned = clean_line(line)
+            if cleaned:
+                yield cleaned
+
+    def __repr__(self) -> str:
+        """Names the stages and their settings, so it doubles as a cache signature"""
+        return f"CleaningPipeline({', '.join(getattr(s, '__name__', None) or repr(s) for s in self.stages)})"
+
+DEFAULT_PIPELINE = CleaningPipeline()
+
+def build_pipeline(normalize: bool = False, dedup: bool = False,
+                   min_chars: int = 1, max_chars: Optional[int] = None) -> CleaningPipeline:
+    """Default stages plus the optional whitespace, length and dedup stages"""
+    stages: List[Stage] = list(DEFAULT_STAGES)
+    if normalize:
+        stages.append(normalize_whitespace)
+    if min_chars > 1 or max_chars is not None:
+        stages.append(LengthFilter(min_chars, max_chars))
+    if dedup:
+        stages.append(DedupFilter())
+    return CleaningPipeline(stages)
+
+def synthetic_lines(n: int, seed: int = 0) -> List[str]:
+    """Transcript-like lines for benchmarking: stage directions, stray spaces, repeats"""
+    rng = random.Random(seed)
+    words = "that's what she said bears beets battlestar galactica paper sales dunder mifflin".split()
+    directions = ['[laughs]', '[to camera]', '[sighs]', '[whispering]']
+    lines = []
+    for _ in range(n):
+        parts = [rng.choice(words) for _ in range(rng.randint(2, 14))]
+        if rng.random() < 0.3:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(directions))
+        if rng.random() < 0.1:
+            parts.append(' ')
+        lines.append('  '.join(parts) if rng.random() < 0.1 else ' '.join(parts))
+    return lines
+
+def benchmark_cleaning(lines: Sequence[str] = None, repeat: int = 5):
+    """Print lines/second for the old per-line re.sub loop and the pipeline"""
+    lines = lines or synthetic_lines(200_000)
+
+    def legacy(lines):
+        out = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            line = re.sub(r'\[.*?\]', '', line).strip()
+            if line:
+                out.append(line)
+        return out
+
+    runs = [
+        ('legacy re.sub loop', legacy),
+        ('default pipeline', lambda lines: list(DEFAULT_PIPELINE.clean(lines))),
+        ('full pipeline', lambda lines: list(
+            build_pipeline(normalize=True, dedup=True, min_chars=3, max_chars=500).cleaner().clean(lines)
+        ))
+    ]
+
+    print("=== LINE CLEANING THROUGHPUT ===\n")
+    print(f"{'stages':<20} {'lines/s':>12} {'kept':>8}")
+    for name, run in runs:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            kept = len(run(lines))
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<20} {len(lines) / best:>12,.0f} {kept:>8}")
+
+if __name__ == "__main__":
+    import sys
+    if "--input" in sys.argv:
+        # Benchmark on a real transcript dump, one line per row
+        with open(sys.argv[sys.argv.index("--input") + 1], 'r', encoding='utf-8') as f:
+            benchmark_cleaning(f.read().splitlines())
+    else:
+        benchmark_cleaning()
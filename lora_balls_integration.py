@@ -5,100 +5,477 @@ Combines trained character LoRAs with BALLS orchestration for authentic Office d
 """
 
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, DynamicCache, TextIteratorStreamer
 from peft import PeftModel
-from typing import Dict, List, Optional
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import os
-import json
-from balls_engine import BALLSEngine, CHARACTER_SPHERES, TopicType
+import itertools
+import queue
+import threading
+import time
+import numpy as np
+from balls_engine import BALLSEngine, TopicType
+
+# Sampling settings shared by single and batched generation
+GENERATION_KWARGS = {
+    'temperature': 0.8,
+    'do_sample': True,
+    'repetition_penalty': 1.1
+}
+
+def format_character_prompt(prompt: str) -> str:
+    """Wrap a prompt in the chat format the character LoRAs were trained on"""
+    return f"<|user|>\n{prompt}\n<|assistant|>\n"
+
+def extract_character_response(full_response: str, formatted_prompt: str) -> str:
+    """Extract just the assistant's response from a decoded sequence"""
+    if "<|assistant|>" in full_response:
+        return full_response.split("<|assistant|>")[-1].strip()
+    return full_response[len(formatted_prompt):].strip()
+
+def _module_memory_bytes(module: torch.nn.Module, adapter_name: str = None) -> int:
+    """Parameter memory of a module, optionally restricted to one named adapter"""
+    total = 0
+    for name, param in module.named_parameters():
+        if adapter_name is None or f".{adapter_name}." in name:
+            total += param.numel() * param.element_size()
+    return total
+
+class LoRAModelPool:
+    """
+    One shared base model per process with character LoRAs attached as
+    named PEFT adapters. Adapters are kept in LRU order and evicted once
+    their combined memory exceeds the budget.
+    """
+    
+    def __init__(self, base_model: str = "microsoft/DialoGPT-medium", adapter_memory_budget_mb: float = 512.0):
+        self.base_model = base_model
+        self.adapter_memory_budget_mb = adapter_memory_budget_mb
+        self.model = None
+        self.base_memory_bytes = 0
+        self.base_load_time = 0.0
+        self.adapters = OrderedDict()  # adapter name -> {'path', 'memory_bytes', 'load_time'}
+        self.tokenizer = None
+        self.lock = threading.RLock()
+        
+    def _load_base_model(self) -> torch.nn.Module:
+        print(f"📥 Loading shared base model {self.base_model}")
+        start = time.perf_counter()
+        base_model = AutoModelForCausalLM.from_pretrained(
+            self.base_model,
+            torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
+            device_map="auto" if torch.cuda.is_available() else None
+        )
+        self.base_load_time = time.perf_counter() - start
+        self.base_memory_bytes = _module_memory_bytes(base_model)
+        return base_model
+    
+    def has_adapter(self, adapter_name: str) -> bool:
+        return adapter_name in self.adapters
+    
+    def load_adapter(self, adapter_name: str, model_path: str, pinned: Tuple[str, ...] = ()):
+        """Attach a LoRA adapter to the shared base model if it isn't already"""
+        with self.lock:
+            if adapter_name in self.adapters:
+                self.adapters.move_to_end(adapter_name)
+                return
+            
+            if self.model is None:
+                base_model = self._load_base_model()
+                start = time.perf_counter()
+                self.model = PeftModel.from_pretrained(base_model, model_path, adapter_name=adapter_name)
+                self.model.eval()
+            else:
+                start = time.perf_counter()
+                self.model.load_adapter(model_path, adapter_name=adapter_name)
+            
+            self.adapters[adapter_name] = {
+                'path': model_path,
+                'memory_bytes': _module_memory_bytes(self.model, adapter_name),
+                'load_time': time.perf_counter() - start
+            }
+            self._evict(keep=(adapter_name,) + tuple(pinned))
+    
+    def _evict(self, keep: Tuple[str, ...]):
+        """Drop least recently used adapters until the budget is respected"""
+        budget = self.adapter_memory_budget_mb * 1024 * 1024
+        while self.adapter_memory_bytes() > budget:
+            victim = next((name for name in self.adapters if name not in keep), None)
+            if victim is None:
+                break
+            print(f"♻️  Evicting {victim} LoRA adapter")
+            self.model.delete_adapter(victim)
+            del self.adapters[victim]
+    
+    def activate(self, adapter_name: str, model_path: str) -> PeftModel:
+        """Make an adapter current, loading it again if it was evicted"""
+        with self.lock:
+            self.load_adapter(adapter_name, model_path)
+            self.adapters.move_to_end(adapter_name)
+            self.model.set_adapter(adapter_name)
+            return self.model
+    
+    def get_tokenizer(self) -> AutoTokenizer:
+        """Left-padding tokenizer of the base model, used for batched generation"""
+        with self.lock:
+            if self.tokenizer is None:
+                self.tokenizer = AutoTokenizer.from_pretrained(self.base_model, padding_side="left")
+                if self.tokenizer.pad_token is None:
+                    self.tokenizer.pad_token = self.tokenizer.eos_token
+            return self.tokenizer
+    
+    def generate_batch(self, prompts: List[str], adapters: List[Tuple[str, str]], max_length: int = 100) -> List[str]:
+        """
+        Generate one response per prompt in a single mixed-adapter batch
+        adapters holds an (adapter name, model path) pair for each prompt
+        """
+        tokenizer = self.get_tokenizer()
+        formatted_prompts = [format_character_prompt(prompt) for prompt in prompts]
+        inputs = tokenizer(formatted_prompts, return_tensors="pt", padding=True)
+        if torch.cuda.is_available():
+            inputs = inputs.to("cuda")
+        
+        names = tuple(name for name, _ in adapters)
+        with self.lock, torch.no_grad():
+            for name, path in adapters:
+                self.load_adapter(name, path, pinned=names)
+                self.adapters.move_to_end(name)
+            outputs = self.model.generate(
+                **inputs,
+                adapter_names=list(names),
+                max_new_tokens=max_length,
+                pad_token_id=tokenizer.eos_token_id,
+                eos_token_id=tokenizer.eos_token_id,
+                **GENERATION_KWARGS
+            )
+        
+        return [
+            extract_character_response(tokenizer.decode(output, skip_special_tokens=True), formatted_prompt)
+            for output, formatted_prompt in zip(outputs, formatted_prompts)
+        ]
+    
+    def adapter_memory_bytes(self) -> int:
+        return sum(info['memory_bytes'] for info in self.adapters.values())
+    
+    def has_capacity(self) -> bool:
+        """Whether one more adapter of average size fits without evicting anything"""
+        if not self.adapters:
+            return True
+        used = self.adapter_memory_bytes()
+        return used + used / len(self.adapters) <= self.adapter_memory_budget_mb * 1024 * 1024
+
+# Shared pools keyed by base model name
+_MODEL_POOLS: Dict[str, LoRAModelPool] = {}
+
+def get_model_pool(base_model: str = "microsoft/DialoGPT-medium", adapter_memory_budget_mb: float = None) -> LoRAModelPool:
+    """Get the process-wide pool for a base model, creating it on first use"""
+    pool = _MODEL_POOLS.get(base_model)
+    if pool is None:
+        pool = _MODEL_POOLS[base_model] = LoRAModelPool(base_model)
+    if adapter_memory_budget_mb is not None:
+        pool.adapter_memory_budget_mb = adapter_memory_budget_mb
+    return pool
+
+@dataclass
+class GenerationRequest:
+    """A pending turn waiting for a batch slot"""
+    adapter_name: str
+    model_path: str
+    prompt: str
+    max_length: int = 100
+    future: Future = field(default_factory=Future)
+
+class GenerationScheduler:
+    """
+    Collects pending turns from concurrent meetings and runs them as padded
+    mixed-adapter batches on the shared model pool, then hands each result
+    back to the meeting that asked for it
+    """
+    
+    def __init__(self, model_pool: LoRAModelPool = None, max_batch_size: int = 16, max_wait_ms: float = 20.0):
+        self.model_pool = model_pool or get_model_pool()
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batches_run = 0
+        self.requests_served = 0
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="lora-scheduler", daemon=True)
+        self._worker.start()
+    
+    def submit(self, adapter_name: str, model_path: str, prompt: str, max_length: int = 100) -> Future:
+        """Queue a turn; the future resolves to the generated response"""
+        request = GenerationRequest(adapter_name, model_path, prompt, max_length)
+        self._queue.put(request)
+        return request.future
+    
+    def close(self):
+        """Stop the worker once already queued turns are served"""
+        self._queue.put(None)
+        self._worker.join()
+    
+    def _collect(self) -> List[Optional[GenerationRequest]]:
+        """Block for one request, then gather more until the batch fills or the wait expires"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while batch[-1] is not None and len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        running = True
+        while running:
+            batch = self._collect()
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+            
+            # Requests only share a batch when they want the same number of new tokens
+            by_length: Dict[int, List[GenerationRequest]] = {}
+            for request in batch:
+                if request.future.set_running_or_notify_cancel():
+                    by_length.setdefault(request.max_length, []).append(request)
+            
+            for max_length, requests in by_length.items():
+                try:
+                    responses = self.model_pool.generate_batch(
+                        [r.prompt for r in requests],
+                        [(r.adapter_name, r.model_path) for r in requests],
+                        max_length
+                    )
+                except Exception as e:
+                    for request in requests:
+                        request.future.set_exception(e)
+                    continue
+                
+                for request, response in zip(requests, responses):
+                    request.future.set_result(response)
+                self.batches_run += 1
+                self.requests_served += len(requests)
+
+class PromptCache:
+    """
+    Per-meeting, per-character past-key-values for the prompt prefix that
+    consecutive turns share. Entries are LRU-bounded, and each one is cropped
+    back to the longest common token prefix when the conversation window
+    slides, so only the tokens after it are encoded again.
+    """
+    
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.reused_tokens = 0
+        self.prompt_tokens = 0
+        self._entries = OrderedDict()  # (meeting id, character) -> (token ids, cache)
+        self._lock = threading.Lock()
+    
+    def take(self, key: Hashable, input_ids: List[int]) -> Tuple[Optional[DynamicCache], int]:
+        """Remove and return the cached prefix for key, cropped to what input_ids still shares"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            self.prompt_tokens += len(input_ids)
+        if entry is None:
+            return None, 0
+        
+        cached_ids, cache = entry
+        # generate() needs at least one uncached token to start from
+        limit = min(len(cached_ids), len(input_ids) - 1)
+        shared = 0
+        while shared < limit and cached_ids[shared] == input_ids[shared]:
+            shared += 1
+        if shared == 0:
+            return None, 0
+        
+        cache.crop(shared)
+        with self._lock:
+            self.reused_tokens += shared
+        return cache, shared
+    
+    def store(self, key: Hashable, token_ids: List[int], cache):
+        """Keep the cache generate() left behind, covering token_ids up to its length"""
+        if not isinstance(cache, DynamicCache):
+            cache = DynamicCache.from_legacy_cache(cache)
+        with self._lock:
+            self._entries[key] = (token_ids[:cache.get_seq_length()], cache)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, meeting_id: Hashable):
+        """Drop every entry belonging to a meeting"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == meeting_id]:
+                del self._entries[key]
 
 class CharacterLoRAModel:
-    """Wrapper for a character-specific LoRA model"""
+    """Wrapper for a character-specific LoRA adapter on the shared base model"""
     
-    def __init__(self, character_name: str, model_path: str, base_model: str = "microsoft/DialoGPT-medium"):
+    def __init__(self, character_name: str, model_path: str, base_model: str = "microsoft/DialoGPT-medium",
+                 model_pool: LoRAModelPool = None):
         self.character_name = character_name
         self.model_path = model_path
         self.base_model = base_model
-        self.model = None
+        self.model_pool = model_pool or get_model_pool(base_model)
         self.tokenizer = None
-        self.loaded = False
         
+    @property
+    def loaded(self) -> bool:
+        return self.tokenizer is not None and self.model_pool.has_adapter(self.character_name)
+    
     def load_model(self):
-        """Load the LoRA model on demand"""
+        """Load the LoRA adapter on demand"""
         if self.loaded:
             return
             
         print(f"🎭 Loading {self.character_name} LoRA from {self.model_path}")
         
         # Load tokenizer
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
-        if self.tokenizer.pad_token is None:
-            self.tokenizer.pad_token = self.tokenizer.eos_token
-            
-        # Load base model
-        base_model = AutoModelForCausalLM.from_pretrained(
-            self.base_model,
-            torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-            device_map="auto" if torch.cuda.is_available() else None
-        )
+        if self.tokenizer is None:
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+            if self.tokenizer.pad_token is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
         
-        # Load LoRA weights
-        self.model = PeftModel.from_pretrained(base_model, self.model_path)
-        self.model.eval()
+        # Attach LoRA weights to the shared base model
+        self.model_pool.load_adapter(self.character_name, self.model_path)
         
-        self.loaded = True
         print(f"✅ {self.character_name} LoRA loaded successfully")
     
-    def generate_response(self, prompt: str, max_length: int = 100) -> str:
-        """Generate a response using the character LoRA"""
-        if not self.loaded:
-            self.load_model()
-            
-        # Format prompt for the character
-        formatted_prompt = f"<|user|>\n{prompt}\n<|assistant|>\n"
-        
+    def _generate(self, formatted_prompt: str, max_length: int, prompt_cache: PromptCache = None,
+                  cache_key: Hashable = None, streamer: TextIteratorStreamer = None) -> torch.Tensor:
+        """Encode, generate on the shared model and refresh the prompt cache; returns the token ids"""
         # Tokenize
         inputs = self.tokenizer.encode(formatted_prompt, return_tensors="pt")
         if torch.cuda.is_available():
             inputs = inputs.cuda()
+        
+        use_cache = prompt_cache is not None and cache_key is not None
+        past_key_values = None
+        if use_cache:
+            past_key_values, _ = prompt_cache.take(cache_key, inputs[0].tolist())
             
-        # Generate
-        with torch.no_grad():
-            outputs = self.model.generate(
+        # Generate with this character's adapter active on the shared model
+        with self.model_pool.lock, torch.no_grad():
+            model = self.model_pool.activate(self.character_name, self.model_path)
+            generated = model.generate(
                 inputs,
+                past_key_values=past_key_values,
                 max_length=inputs.shape[1] + max_length,
                 num_return_sequences=1,
-                temperature=0.8,
-                do_sample=True,
                 pad_token_id=self.tokenizer.eos_token_id,
                 eos_token_id=self.tokenizer.eos_token_id,
-                repetition_penalty=1.1
+                return_dict_in_generate=True,
+                streamer=streamer,
+                **GENERATION_KWARGS
             )
+        outputs = generated.sequences
+        
+        if use_cache:
+            prompt_cache.store(cache_key, outputs[0].tolist(), generated.past_key_values)
+        return outputs[0]
+    
+    def generate_response(self, prompt: str, max_length: int = 100, prompt_cache: PromptCache = None,
+                          cache_key: Hashable = None) -> str:
+        """
+        Generate a response using the character LoRA
+        With a prompt cache, the prefix shared with this key's last prompt is not re-encoded
+        """
+        if not self.loaded:
+            self.load_model()
+            
+        # Format prompt for the character
+        formatted_prompt = format_character_prompt(prompt)
+        output = self._generate(formatted_prompt, max_length, prompt_cache, cache_key)
         
         # Decode response
-        full_response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        full_response = self.tokenizer.decode(output, skip_special_tokens=True)
+        return extract_character_response(full_response, formatted_prompt)
+    
+    def stream_response(self, prompt: str, max_length: int = 100, prompt_cache: PromptCache = None,
+                        cache_key: Hashable = None) -> Iterator[str]:
+        """Yield the response text incrementally as tokens are generated"""
+        if not self.loaded:
+            self.load_model()
         
-        # Extract just the assistant's response
-        if "<|assistant|>" in full_response:
-            response = full_response.split("<|assistant|>")[-1].strip()
-        else:
-            response = full_response[len(formatted_prompt):].strip()
-            
-        return response
+        formatted_prompt = format_character_prompt(prompt)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors = []
+        
+        def run():
+            try:
+                self._generate(formatted_prompt, max_length, prompt_cache, cache_key, streamer=streamer)
+            except Exception as e:
+                errors.append(e)
+                streamer.end()  # Unblock the consumer
+        
+        worker = threading.Thread(target=run, name=f"{self.character_name}-stream", daemon=True)
+        worker.start()
+        for text in streamer:
+            yield text
+        worker.join()
+        
+        if errors:
+            raise errors[0]
 
 class BALLSLoRAOrchestrator:
     """
     The main orchestrator that combines BALLS dynamics with character LoRAs
+    
+    One orchestrator can run many meetings at once: per-meeting state lives
+    in stream_meeting, and the roster is fixed once the adapters are found.
+    Call close() (or use it as a context manager) to stop its loader thread.
     """
     
-    def __init__(self, lora_models_dir: str = "lora_models"):
+    def __init__(self, lora_models_dir: str = "lora_models", adapter_memory_budget_mb: float = None,
+                 scheduler: GenerationScheduler = None, prompt_cache_entries: int = 64, seed=None,
+                 draft_max_tokens: int = 48):
         self.lora_models_dir = lora_models_dir
+        # The pool is process-wide, so only an explicit budget changes it
+        self.model_pool = get_model_pool(adapter_memory_budget_mb=adapter_memory_budget_mb)
+        self.scheduler = scheduler  # Shared batching scheduler for concurrent meetings
         self.character_models = {}
-        self.balls_engine = BALLSEngine()
+        self.balls_engine = BALLSEngine(seed=seed)
         self.conversation_history = []
+        self.speculation_stats = {'hits': 0, 'misses': 0}
+        
+        # Speculative drafts are kept short so a missed guess costs little
+        self.draft_max_tokens = draft_max_tokens
+        self._draft_scheduler: Optional[GenerationScheduler] = None
+        self._drafts_lock = threading.Lock()
+        
+        # Prompt-prefix KV caches, keyed by (meeting id, character)
+        self.prompt_cache = PromptCache(max_entries=prompt_cache_entries)
+        self._meeting_ids = itertools.count()
+        
+        # Unseeded meetings draw speakers from child streams of this sequence
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._seed_lock = threading.Lock()
+        
+        # Background adapter loading; one worker keeps loads in priority order
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lora-loader")
+        self._load_futures: Dict[str, Future] = {}
         
         # Load available character models
         self._load_available_models()
+        self.balls_engine.active_characters = list(self.character_models.keys())
+    
+    def close(self):
+        """Stop background adapter loading and drafting; work already running finishes first"""
+        self._loader.shutdown(wait=True, cancel_futures=True)
+        if self._draft_scheduler is not None:
+            self._draft_scheduler.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
         
     def _load_available_models(self):
         """Load all available character LoRA models"""
@@ -110,38 +487,125 @@ class BALLSLoRAOrchestrator:
                 print(f"📁 Found {character} LoRA at {model_path}")
                 self.character_models[character.capitalize()] = CharacterLoRAModel(
                     character_name=character.capitalize(),
-                    model_path=model_path
+                    model_path=model_path,
+                    model_pool=self.model_pool
                 )
             else:
                 print(f"⚠️  {character} LoRA not found at {model_path}")
                 
         print(f"🎭 Loaded {len(self.character_models)} character LoRAs")
     
-    def start_meeting(self, topic: str, max_turns: int = 15) -> List[Dict]:
+    def prefetch_models(self, probabilities: Dict[str, float]):
+        """Queue background loads for the roster, likeliest speakers first"""
+        for char in sorted(probabilities, key=probabilities.get, reverse=True):
+            model = self.character_models.get(char)
+            if model is None or model.loaded:
+                continue
+            future = self._load_futures.get(char)
+            if future is not None and not future.done():
+                continue
+            self._load_futures[char] = self._loader.submit(self._prefetch_model, model)
+    
+    def _prefetch_model(self, model: CharacterLoRAModel):
+        # Prefetching must never evict an adapter a likelier speaker needs
+        if model.loaded or not self.model_pool.has_capacity():
+            return
+        model.load_model()
+    
+    def _wait_for_model(self, character: str):
+        """Block only if this character's adapter is still loading"""
+        future = self._load_futures.pop(character, None)
+        if future is not None and not future.cancel():
+            future.result()
+        # Covers cancelled, skipped and evicted loads
+        self.character_models[character].load_model()
+    
+    def _speculative_candidates(self, topic_type: TopicType, speaker: str, k: int) -> List[str]:
+        """Top-k likeliest speakers for the turn after `speaker`, honoring the back-to-back rule"""
+        probabilities = self.balls_engine.calculate_speaking_probabilities(topic_type)
+        if self.balls_engine.spheres[speaker].dominance_factor < 0.8:
+            probabilities.pop(speaker, None)
+        ranked = sorted(probabilities, key=probabilities.get, reverse=True)
+        return [char for char in ranked if char in self.character_models and probabilities[char] > 0][:k]
+    
+    @staticmethod
+    def _build_context_prompt(topic: str, recent_context: List[str], speaker: str) -> str:
+        return f"Topic: {topic}\nRecent conversation: {' '.join(recent_context)}\nRespond as {speaker} from The Office:"
+    
+    def _draft_replies(self, topic: str, recent_context: List[str], candidates: List[str]) -> Dict[str, Future]:
+        """
+        Queue short drafts of the next turn for each candidate speaker
+        They batch on the shared scheduler (or this orchestrator's own) and
+        only see the context of the turn being generated now
+        """
+        if not candidates:
+            return {}
+        scheduler = self.scheduler
+        if scheduler is None:
+            with self._drafts_lock:
+                if self._draft_scheduler is None:
+                    self._draft_scheduler = GenerationScheduler(self.model_pool)
+                scheduler = self._draft_scheduler
+        return {
+            char: scheduler.submit(
+                char, self.character_models[char].model_path,
+                self._build_context_prompt(topic, recent_context, char), self.draft_max_tokens
+            )
+            for char in candidates
+        }
+    
+    def start_meeting(self, topic: str, max_turns: int = 15, speculative_k: int = 0, seed=None) -> List[Dict]:
         """
         Start an Office meeting with BALLS orchestration and LoRA responses
+        
+        With speculative_k > 0, while each turn is generated the k likeliest
+        next speakers get short drafted replies in a background batch. If BALLS
+        picks one of them the draft is used as-is, logged with response_type
+        'lora_draft' since it was written before the message just before it
+        existed; the rest are discarded.
+        """
+        for event in self.stream_meeting(topic, max_turns, speculative_k, seed):
+            if event['event'] == 'meeting_end':
+                return event['meeting_log']
+    
+    def stream_meeting(self, topic: str, max_turns: int = 15, speculative_k: int = 0,
+                       seed=None) -> Iterator[Dict]:
+        """
+        Run a meeting as a stream of events: 'turn' for each log entry,
+        'turn_start' once a speaker is picked, 'token' for text as it is
+        generated, and 'meeting_end' with the full log
+        
+        Every generated reply arrives through 'token' events in every mode:
+        incrementally on the default path, and as one event carrying the
+        finished reply when it comes from a speculative draft or the batch
+        scheduler (those paths don't use the prompt cache either)
+        
+        Speaker order comes from a per-meeting generator, so the same
+        (topic, seed) always picks the same speakers
         """
+        if seed is None:
+            with self._seed_lock:
+                seed = self._seed_sequence.spawn(1)[0]
+        rng = np.random.default_rng(seed)
+        
         print(f"\n🏢 === BALLS + LoRA OFFICE MEETING ===")
         print(f"📋 Topic: {topic}")
         
-        available_characters = list(self.character_models.keys())
+        available_characters = self.balls_engine.active_characters
         print(f"👥 Available Characters: {', '.join(available_characters)}")
         
-        # Update BALLS engine with available characters
-        self.balls_engine.active_characters = available_characters
-        
         # Analyze initial topic
         topic_type = self.balls_engine.analyze_topic(topic)
         print(f"📊 BALLS Topic Analysis: {topic_type.value}")
         
         # Show initial sphere dynamics
         probabilities = self.balls_engine.calculate_speaking_probabilities(topic_type)
+        radii = self.balls_engine.calculate_sphere_radii(topic_type)
+        self.prefetch_models(probabilities)
         print(f"\n⚡ Initial BALLS Probabilities:")
         for char, prob in sorted(probabilities.items(), key=lambda x: x[1], reverse=True):
             if char in self.character_models:
-                sphere = CHARACTER_SPHERES[char]
-                radius = sphere.calculate_radius(topic_type)
-                print(f"   {char}: {prob:.1%} (sphere: {radius:.2f})")
+                print(f"   {char}: {prob:.1%} (sphere: {radii[char]:.2f})")
         
         # Initialize meeting log
         meeting_log = [{
@@ -152,7 +616,7 @@ class BALLSLoRAOrchestrator:
             'response_type': 'human',
             'sphere_analysis': {
                 char: {
-                    'radius': CHARACTER_SPHERES[char].calculate_radius(topic_type),
+                    'radius': radii[char],
                     'probability': probabilities[char]
                 } for char in available_characters
             }
@@ -160,80 +624,159 @@ class BALLSLoRAOrchestrator:
         
         print(f"\n💬 Meeting Transcript:")
         print(f"[Moderator]: {topic}")
+        yield {'event': 'turn', 'entry': meeting_log[0]}
         
         # Run meeting simulation
+        meeting_id = next(self._meeting_ids)
         last_speaker = None
+        speculated = {}  # speaker -> response drafted ahead for this turn
+        # Counted per meeting; the attribute shows the latest one started
+        speculation_stats = self.speculation_stats = {'hits': 0, 'misses': 0}
         
-        for turn in range(1, max_turns + 1):
-            # BALLS determines next speaker
-            exclude = []
-            if last_speaker and CHARACTER_SPHERES[last_speaker].dominance_factor < 0.8:
-                exclude = [last_speaker]
+        try:
+            for turn in range(1, max_turns + 1):
+                # BALLS determines next speaker
+                exclude = []
+                if last_speaker and self.balls_engine.spheres[last_speaker].dominance_factor < 0.8:
+                    exclude = [last_speaker]
                 
-            next_speaker = self.balls_engine.select_next_speaker(topic, exclude)
-            
-            # Skip if character LoRA not available
-            if next_speaker not in self.character_models:
-                continue
+                next_speaker = self.balls_engine.select_next_speaker(topic_type, exclude, rng)
                 
-            # Generate character response using LoRA
-            character_model = self.character_models[next_speaker]
-            
-            # Create context from recent conversation
-            recent_context = [entry['message'] for entry in meeting_log[-3:]]
-            context_prompt = f"Topic: {topic}\nRecent conversation: {' '.join(recent_context)}\nRespond as {next_speaker} from The Office:"
-            
-            try:
-                response = character_model.generate_response(context_prompt)
-                response_type = 'lora'
-            except Exception as e:
-                print(f"⚠️  Error generating LoRA response for {next_speaker}: {e}")
-                response = f"[{next_speaker} would respond here, but LoRA failed]"
-                response_type = 'fallback'
-            
-            # Update topic based on response
-            current_topic_type = self.balls_engine.analyze_topic(response)
-            current_probabilities = self.balls_engine.calculate_speaking_probabilities(current_topic_type)
-            
-            # Log the turn
-            turn_data = {
-                'turn': turn,
-                'speaker': next_speaker,
-                'message': response,
-                'topic_type': current_topic_type.value,
-                'response_type': response_type,
-                'sphere_analysis': {
-                    char: {
-                        'radius': CHARACTER_SPHERES[char].calculate_radius(current_topic_type),
-                        'probability': current_probabilities[char]
-                    } for char in available_characters
+                # Skip if character LoRA not available
+                if next_speaker not in self.character_models:
+                    continue
+                
+                drafts, speculated = speculated, {}
+                if drafts:
+                    speculation_stats['hits' if next_speaker in drafts else 'misses'] += 1
+                    # Drafts for anyone else are dropped if they haven't started yet
+                    for char, future in drafts.items():
+                        if char != next_speaker:
+                            future.cancel()
+                
+                # Generate character response using LoRA
+                character_model = self.character_models[next_speaker]
+                
+                # Create context from recent conversation
+                recent_context = [entry['message'] for entry in meeting_log[-3:]]
+                context_prompt = self._build_context_prompt(topic, recent_context, next_speaker)
+                yield {'event': 'turn_start', 'turn': turn, 'speaker': next_speaker}
+                
+                # Likeliest speakers after this one, drafted while this turn is generated
+                candidates = []
+                if speculative_k > 0:
+                    candidates = self._speculative_candidates(topic_type, next_speaker, speculative_k)
+                
+                streamed = False
+                try:
+                    if next_speaker in drafts:
+                        speculated = self._draft_replies(topic, recent_context, candidates)
+                        response = drafts[next_speaker].result()
+                        response_type = 'lora_draft'
+                    elif self.scheduler is not None:
+                        self._wait_for_model(next_speaker)
+                        future = self.scheduler.submit(next_speaker, character_model.model_path, context_prompt)
+                        speculated = self._draft_replies(topic, recent_context, candidates)
+                        response = future.result()
+                        response_type = 'lora'
+                    else:
+                        self._wait_for_model(next_speaker)
+                        chunks = []
+                        drafted = False
+                        for text in character_model.stream_response(
+                            context_prompt, prompt_cache=self.prompt_cache, cache_key=(meeting_id, next_speaker)
+                        ):
+                            if not drafted:
+                                # This turn holds the model now, so the drafts queue behind it
+                                speculated = self._draft_replies(topic, recent_context, candidates)
+                                drafted = True
+                            chunks.append(text)
+                            yield {'event': 'token', 'turn': turn, 'speaker': next_speaker, 'text': text}
+                        formatted_prompt = format_character_prompt(context_prompt)
+                        response = extract_character_response(formatted_prompt + ''.join(chunks), formatted_prompt)
+                        streamed = True
+                        response_type = 'lora'
+                except Exception as e:
+                    print(f"⚠️  Error generating LoRA response for {next_speaker}: {e}")
+                    response = f"[{next_speaker} would respond here, but LoRA failed]"
+                    response_type = 'fallback'
+                
+                if response_type != 'fallback' and not streamed:
+                    # Drafted or batched replies are finished already; deliver them whole
+                    yield {'event': 'token', 'turn': turn, 'speaker': next_speaker, 'text': response}
+                
+                # Update topic based on response
+                current_topic_type = self.balls_engine.analyze_topic(response)
+                current_probabilities = self.balls_engine.calculate_speaking_probabilities(current_topic_type)
+                current_radii = self.balls_engine.calculate_sphere_radii(current_topic_type)
+                
+                # Log the turn
+                turn_data = {
+                    'turn': turn,
+                    'speaker': next_speaker,
+                    'message': response,
+                    'topic_type': current_topic_type.value,
+                    'response_type': response_type,
+                    'sphere_analysis': {
+                        char: {
+                            'radius': current_radii[char],
+                            'probability': current_probabilities[char]
+                        } for char in available_characters
+                    }
                 }
-            }
-            meeting_log.append(turn_data)
-            
-            # Print the exchange
-            sphere_size = CHARACTER_SPHERES[next_speaker].calculate_radius(current_topic_type)
-            prob = current_probabilities[next_speaker]
-            response_indicator = "🤖" if response_type == 'lora' else "⚠️"
-            print(f"[{next_speaker}] {response_indicator}(⚡{prob:.1%}, 🔮{sphere_size:.2f}): {response}")
-            
-            last_speaker = next_speaker
+                meeting_log.append(turn_data)
+                
+                # Print the exchange
+                sphere_size = current_radii[next_speaker]
+                prob = current_probabilities[next_speaker]
+                response_indicator = "⚠️" if response_type == 'fallback' else "🤖"
+                print(f"[{next_speaker}] {response_indicator}(⚡{prob:.1%}, 🔮{sphere_size:.2f}): {response}")
+                yield {'event': 'turn', 'entry': turn_data}
+                
+                last_speaker = next_speaker
+        finally:
+            for future in speculated.values():
+                future.cancel()
+            self.prompt_cache.invalidate(meeting_id)
+        
+        if speculative_k > 0:
+            print(f"🔮 Speculation: {speculation_stats['hits']} hits, {speculation_stats['misses']} misses")
         
         print(f"\n🏁 === MEETING ENDED ===")
         self.conversation_history = meeting_log
-        return meeting_log
+        yield {'event': 'meeting_end', 'meeting_log': meeting_log}
     
     def get_model_status(self) -> Dict:
-        """Get status of all character models"""
+        """Get status of all character models, including load time and memory use"""
         status = {}
+        base_memory_mb = self.model_pool.base_memory_bytes / (1024 * 1024)
         for char, model in self.character_models.items():
+            adapter = self.model_pool.adapters.get(char, {})
+            future = self._load_futures.get(char)
             status[char] = {
                 'loaded': model.loaded,
+                'loading': future is not None and not future.done(),
                 'path': model.model_path,
-                'available': os.path.exists(model.model_path)
+                'available': os.path.exists(model.model_path),
+                'load_time_s': adapter.get('load_time', 0.0),
+                'adapter_memory_mb': adapter.get('memory_bytes', 0) / (1024 * 1024),
+                'shared_base_memory_mb': base_memory_mb
             }
         return status
 
+def run_concurrent_meetings(topics: List[str], max_turns: int = 15, lora_models_dir: str = "lora_models",
+                            max_batch_size: int = 16) -> List[List[Dict]]:
+    """Run one meeting per topic concurrently on one orchestrator, batching their turns through one scheduler"""
+    scheduler = GenerationScheduler(max_batch_size=max_batch_size)
+    
+    try:
+        with BALLSLoRAOrchestrator(lora_models_dir, scheduler=scheduler) as orchestrator, \
+                ThreadPoolExecutor(max_workers=max(len(topics), 1), thread_name_prefix="meeting") as executor:
+            return list(executor.map(lambda topic: orchestrator.start_meeting(topic, max_turns), topics))
+    finally:
+        scheduler.close()
+        print(f"📦 {scheduler.requests_served} turns served in {scheduler.batches_run} batches")
+
 def demo_lora_balls():
     """Demo the BALLS + LoRA integration"""
     orchestrator = BALLSLoRAOrchestrator()
@@ -254,7 +797,7 @@ def demo_lora_balls():
     meeting_log = orchestrator.start_meeting(test_topic, max_turns=8)
     
     # Count LoRA vs fallback responses
-    lora_responses = sum(1 for entry in meeting_log if entry.get('response_type') == 'lora')
+    lora_responses = sum(1 for entry in meeting_log if entry.get('response_type') in ('lora', 'lora_draft'))
     total_responses = len([entry for entry in meeting_log if entry.get('response_type')])
     
     print(f"\n📊 Meeting Stats:")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Meeting result cache
+Memoizes seeded meetings keyed by (topic, roster, turns, seed, sphere config)
+
+A seeded meeting always replays the same way, so its log and analytics can
+be served without running the simulator. Entries live in a size-bounded LRU
+with a TTL, optionally backed by a directory of JSON files that survives
+restarts. The directory holds at most max_disk_entries files; when it
+overflows, expired files and then the least recently written are removed.
+Concurrent misses on one key share a single computation.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Bump when meeting generation changes so stale disk entries are ignored
+CACHE_VERSION = 4
+
+class MeetingResultCache:
+    """TTL + LRU cache of meeting results, with an optional on-disk tier"""
+
+    def __init__(self, max_entries: int = 256, ttl_s: float = 3600.0, disk_dir: str = None,
+                 max_disk_entries: int = 4096):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expiry time, result)
+        self._pending: Dict[Hashable, Future] = {}  # keys being computed
+        self._lock = threading.Lock()
+
+        self._disk_entries = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_entries = len(self._disk_files())
+
+    @staticmethod
+    def key(topic: str, roster: Sequence[str], max_turns: int, seed, spheres: str = '') -> Tuple:
+        """Cache key for one seeded meeting; spheres is the sphere config fingerprint"""
+        if isinstance(seed, list):
+            seed = tuple(seed)
+        return (topic, tuple(roster), max_turns, seed, spheres)
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Cached result for key, or None if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, result = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            # Expire when the file does, not a full TTL after this read
+            created, result = entry
+            self._remember(key, result, now + created + self.ttl_s - time.time())
+        return result
+
+    def put(self, key: Hashable, result: Dict):
+        """Store a JSON-serializable result; callers must not mutate it afterwards"""
+        with self._lock:
+            self._remember(key, result, time.monotonic() + self.ttl_s)
+        self._write_disk(key, result)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Dict]) -> Dict:
+        """
+        Cached result for key, computing and storing it on a miss
+        Callers that miss while another is computing the same key wait for its result
+        """
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        with self._lock:
+            # put() stores the result before the pending entry goes, so a
+            # late caller sees one or the other
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            pending = self._pending.get(key)
+            computing = pending is None
+            if computing:
+                pending = self._pending[key] = Future()
+        if not computing:
+            return pending.result()
+
+        try:
+            result = compute()
+            self.put(key, result)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(result)
+        finally:
+            with self._lock:
+                del self._pending[key]
+        return result
+
+    def clear(self):
+        """Drop every entry, including the disk tier"""
+        with self._lock:
+            self._entries.clear()
+            if self.disk_dir:
+                for path in self._disk_files():
+                    _remove_quietly(path)
+                self._disk_entries = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses
+            }
+
+    def _remember(self, key: Hashable, result: Dict, expires: float):
+        """Insert into the memory tier until monotonic time expires; caller holds the lock"""
+        self._entries[key] = (expires, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: Hashable) -> str:
+        digest = hashlib.sha1(json.dumps([CACHE_VERSION, key]).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.json")
+
+    def _read_disk(self, key: Hashable) -> Optional[Tuple[float, Dict]]:
+        """(wall-clock creation time, result) from the disk tier, or None"""
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        created = entry.get('created', 0)
+        if created + self.ttl_s <= time.time():
+            with self._lock:
+                if _remove_quietly(path):
+                    self._disk_entries -= 1
+            return None
+        return created, entry['result']
+
+    def _write_disk(self, key: Hashable, result: Dict):
+        if not self.disk_dir:
+            return
+        # Write then rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'created': time.time(), 'result': result}, f, separators=(',', ':'))
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+        path = self._disk_path(key)
+        with self._lock:
+            if not os.path.exists(path):
+                self._disk_entries += 1
+            os.replace(tmp_path, path)
+            if self._disk_entries > self.max_disk_entries:
+                self._evict_disk()
+
+    def _disk_files(self) -> List[str]:
+        return [os.path.join(self.disk_dir, name) for name in os.listdir(self.disk_dir) if name.endswith('.json')]
+
+    def _evict_disk(self):
+        """
+        Drop expired files, then the oldest, until the disk tier is back to
+        three quarters of max_disk_entries; caller holds the lock
+        """
+        files = []
+        for path in self._disk_files():
+            try:
+                files.append((os.stat(path).st_mtime, path))
+            except OSError:
+                pass
+        files.sort()
+
+        cutoff = time.time() - self.ttl_s
+        target = (3 * self.max_disk_entries) // 4
+        kept = len(files)
+        for written, path in files:
+            if written > cutoff and kept <= target:
+                break
+            _remove_quietly(path)
+            kept -= 1
+        self._disk_entries = kept
+
+def _remove_quietly(path: str) -> bool:
+    """Remove path if it exists; True if this call removed it"""
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
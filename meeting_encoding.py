@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Compact meeting response encoding
+Opt-in alternative to the legacy JSON returned by /api/start_meeting
+
+Clients ask for it with an Accept header of COMPACT_MIMETYPE or a
+?format=compact query flag. The body carries the meeting log in
+ColumnarMeetingLog.to_packed form and is gzip (or brotli, when installed)
+compressed if the client accepts it.
+"""
+
+import gzip
+import json
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPACT_MIMETYPE = 'application/vnd.office-balls.compact+json'
+
+# Below this, compression costs more than it saves
+MIN_COMPRESS_BYTES = 512
+
+def wants_compact(accept: Optional[str], format_flag: Optional[str]) -> bool:
+    """Whether the request negotiated the compact format"""
+    return format_flag == 'compact' or COMPACT_MIMETYPE in (accept or '')
+
+def _accepted_encodings(accept_encoding: Optional[str]) -> set:
+    encodings = set()
+    for token in (accept_encoding or '').split(','):
+        name, _, params = token.strip().partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0'):
+            encodings.add(name.strip().lower())
+    return encodings
+
+def compress_body(body: bytes, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Compress body with the best encoding the client accepts; returns (body, encoding)"""
+    if len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    accepted = _accepted_encodings(accept_encoding)
+    if brotli is not None and 'br' in accepted:
+        return brotli.compress(body, quality=5), 'br'
+    if 'gzip' in accepted:
+        return gzip.compress(body, compresslevel=6), 'gzip'
+    return body, None
+
+def compact_meeting_response(result: Dict, accept_encoding: Optional[str]) -> Tuple[bytes, Dict]:
+    """
+    Encode a columnar meeting_result as a compact body
+    Returns (body, extra response headers)
+    """
+    payload = result['meeting_log'].to_packed()
+    payload['format'] = 'compact'
+    payload['analytics'] = result['analytics']
+    payload['success'] = True
+    
+    body, encoding = compress_body(json.dumps(payload, separators=(',', ':')).encode('utf-8'), accept_encoding)
+    headers = {'Vary': 'Accept, Accept-Encoding'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return body, headers
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Columnar meeting log
+Stores a meeting turn-indexed instead of as a list of nested dicts
+
+Speaker and topic ids, turn numbers and message references sit in flat
+arrays, and each turn's sphere radii and speaking probabilities are one
+float32 row per roster character. The legacy dict entries the API returns
+are only built when an entry is read or the log is serialized.
+"""
+
+import base64
+from typing import Dict, Iterator, List, Sequence, Union
+
+import numpy as np
+
+from balls_engine import TOPIC_INDEX, TOPIC_ORDER, TopicType
+
+class ColumnarMeetingLog:
+    """Append-only, turn-indexed meeting log that reads back as legacy dict entries"""
+
+    def __init__(self, characters: Sequence[str], capacity: int = 16):
+        self.characters = list(characters)
+        # Speaker ids index into speaker_names; the roster comes first, then
+        # anyone else who speaks (the Moderator)
+        self.speaker_names = list(self.characters)
+        self._speaker_ids = {name: i for i, name in enumerate(self.speaker_names)}
+        self.messages: List[str] = []
+
+        capacity = max(capacity, 1)
+        n = len(self.characters)
+        self._length = 0
+        self._turns = np.empty(capacity, dtype=np.int32)
+        self._speakers = np.empty(capacity, dtype=np.int16)
+        self._topics = np.empty(capacity, dtype=np.int8)
+        self._radii = np.empty((capacity, n), dtype=np.float32)
+        self._probabilities = np.empty((capacity, n), dtype=np.float32)
+
+    def append(self, turn: int, speaker: str, message: str, topic: TopicType,
+               radii: Sequence[float], probabilities: Sequence[float]):
+        """Add a turn; radii and probabilities are in roster order"""
+        if self._length == len(self._turns):
+            self._grow()
+        i = self._length
+        self._turns[i] = turn
+        self._speakers[i] = self._speaker_id(speaker)
+        self._topics[i] = TOPIC_INDEX[topic]
+        self._radii[i] = radii
+        self._probabilities[i] = probabilities
+        self.messages.append(message)
+        self._length += 1
+
+    @property
+    def speakers(self) -> np.ndarray:
+        """Speaker id per turn (see speaker_names)"""
+        return self._speakers[:self._length]
+
+    @property
+    def topics(self) -> np.ndarray:
+        """Topic id per turn, indexing balls_engine.TOPIC_ORDER"""
+        return self._topics[:self._length]
+
+    @property
+    def radii(self) -> np.ndarray:
+        return self._radii[:self._length]
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._probabilities[:self._length]
+
+    def entry(self, i: int) -> Dict:
+        """Legacy dict form of one turn"""
+        radii = _short_floats(self._radii[i])
+        probabilities = _short_floats(self._probabilities[i])
+        return {
+            'turn': int(self._turns[i]),
+            'speaker': self.speaker_names[self._speakers[i]],
+            'message': self.messages[i],
+            'topic_type': TOPIC_ORDER[self._topics[i]].value,
+            'sphere_analysis': {
+                char: {
+                    'radius': radii[j],
+                    'probability': probabilities[j]
+                } for j, char in enumerate(self.characters)
+            }
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """The whole log in the legacy list-of-dicts form"""
+        return [self.entry(i) for i in range(self._length)]
+
+    def to_columns(self) -> Dict:
+        """JSON-ready columnar form, for archives and the result cache"""
+        n = self._length
+        return {
+            'characters': self.characters,
+            'speaker_names': self.speaker_names,
+            'turns': self._turns[:n].tolist(),
+            'speakers': self._speakers[:n].tolist(),
+            'topics': [TOPIC_ORDER[t].value for t in self._topics[:n]],
+            'messages': self.messages,
+            'radii': [_short_floats(row) for row in self._radii[:n]],
+            'probabilities': [_short_floats(row) for row in self._probabilities[:n]]
+        }
+
+    def to_packed(self) -> Dict:
+        """
+        Dictionary-encoded form for compact API responses: speakers and topics
+        are ids into name tables, and radii/probabilities are base64 float32
+        (little-endian, row-major: turns x characters)
+        """
+        n = self._length
+        return {
+            'characters': self.characters,
+            'speaker_names': self.speaker_names,
+            'topic_names': [topic.value for topic in TOPIC_ORDER],
+            'turns': self._turns[:n].tolist(),
+            'speakers': self._speakers[:n].tolist(),
+            'topics': self._topics[:n].tolist(),
+            'messages': self.messages,
+            'radii': _pack_floats(self._radii[:n]),
+            'probabilities': _pack_floats(self._probabilities[:n])
+        }
+
+    @classmethod
+    def from_columns(cls, columns: Dict) -> 'ColumnarMeetingLog':
+        """Rebuild a log written by to_columns"""
+        log = cls(columns['characters'], capacity=len(columns['turns']))
+        for turn, speaker, message, topic, radii, probabilities in zip(
+            columns['turns'], columns['speakers'], columns['messages'], columns['topics'],
+            columns['radii'], columns['probabilities']
+        ):
+            log.append(turn, columns['speaker_names'][speaker], message, TopicType(topic), radii, probabilities)
+        return log
+
+    @classmethod
+    def from_dicts(cls, entries: List[Dict], characters: Sequence[str]) -> 'ColumnarMeetingLog':
+        """Compact a legacy list-of-dicts meeting log"""
+        log = cls(characters, capacity=len(entries))
+        for entry in entries:
+            spheres = entry['sphere_analysis']
+            log.append(
+                entry['turn'], entry['speaker'], entry['message'], TopicType(entry['topic_type']),
+                [spheres[char]['radius'] for char in log.characters],
+                [spheres[char]['probability'] for char in log.characters]
+            )
+        return log
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (message strings are shared)"""
+        n = self._length
+        return (self._turns[:n].nbytes + self._speakers[:n].nbytes + self._topics[:n].nbytes
+                + self._radii[:n].nbytes + self._probabilities[:n].nbytes + 8 * len(self.messages))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self.entry(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("meeting log index out of range")
+        return self.entry(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._length):
+            yield self.entry(i)
+
+    def _speaker_id(self, speaker: str) -> int:
+        speaker_id = self._speaker_ids.get(speaker)
+        if speaker_id is None:
+            speaker_id = self._speaker_ids[speaker] = len(self.speaker_names)
+            self.speaker_names.append(speaker)
+        return speaker_id
+
+    def _grow(self):
+        """Double the column capacity"""
+        capacity = 2 * len(self._turns)
+        for name in ('_turns', '_speakers', '_topics', '_radii', '_probabilities'):
+            column = getattr(self, name)
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+def _short_floats(row: np.ndarray) -> List[float]:
+    """float32 values as the shortest decimals that round-trip (0.96, not 0.9599999785)"""
+    return [float(str(value)) for value in row]
+
+def _pack_floats(matrix: np.ndarray) -> str:
+    return base64.b64encode(matrix.astype('<f4').tobytes()).decode('ascii')
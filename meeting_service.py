@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the meeting web servers and the batch CLI
+Demo topics, the seeded-result cache, the hot-reloaded sphere config and
+server-sent event formatting, without importing any web framework
+
+app.py (Flask) and asgi_app.py (Quart) each build their own simulator on
+top of the cache and sphere config defined here, and hand meetings to a
+meeting_workers.MeetingProcessPool through pooled_meeting_result.
+"""
+
+import json
+import os
+from typing import Optional
+
+from balls_engine import SphereConfigFile
+from meeting_cache import MeetingResultCache
+from meeting_log import ColumnarMeetingLog
+from office_meeting_simulator import OfficeMeetingSimulator
+
+# Suggested demo topics
+DEMO_TOPICS = [
+    "We need to discuss the new sales targets",
+    "There's been an HR complaint about workplace behavior",
+    "Someone has been stealing lunches from the refrigerator",
+    "We need to plan the office party",
+    "There are rumors about corporate layoffs",
+    "I think we need better security measures",
+    "The printer is broken again",
+    "We should discuss work-from-home policies"
+]
+
+# Results of seeded meetings; MEETING_CACHE_DIR adds a tier that survives
+# restarts, capped at MEETING_CACHE_DISK_SIZE files since clients pick seeds
+result_cache = MeetingResultCache(
+    max_entries=int(os.environ.get('MEETING_CACHE_SIZE', 256)),
+    ttl_s=float(os.environ.get('MEETING_CACHE_TTL', 3600)),
+    disk_dir=os.environ.get('MEETING_CACHE_DIR'),
+    max_disk_entries=int(os.environ.get('MEETING_CACHE_DISK_SIZE', 4096))
+)
+
+# BALLS_SPHERE_CONFIG=path loads sphere parameters from a JSON file, re-read when it changes
+SPHERE_CONFIG = os.environ.get('BALLS_SPHERE_CONFIG')
+sphere_config = SphereConfigFile(SPHERE_CONFIG) if SPHERE_CONFIG else None
+
+def new_simulator() -> OfficeMeetingSimulator:
+    """Simulator wired to the shared result cache and sphere config"""
+    return OfficeMeetingSimulator(
+        result_cache=result_cache,
+        spheres=sphere_config.registry if sphere_config else None
+    )
+
+def refresh_spheres(target: OfficeMeetingSimulator):
+    """Apply sphere config edits; meetings already running finish on their old engine"""
+    if sphere_config:
+        # A config the simulator rejects (e.g. missing a roster member) is not adopted
+        sphere_config.poll(target.reload_spheres)
+
+def pooled_meeting_result(meeting_pool, target: OfficeMeetingSimulator, topic: str,
+                          max_turns: int, seed: Optional[int]) -> dict:
+    """Columnar meeting_result from a worker process, through the result cache when seeded"""
+    def compute():
+        payload = json.loads(meeting_pool.run_meeting(topic, max_turns, seed, columnar=True))
+        return {'meeting_log': payload['meeting_log'], 'analytics': payload['analytics']}
+    
+    if seed is None:
+        result = compute()
+    else:
+        engine = target.balls_engine
+        key = result_cache.key(topic, engine.active_characters, max_turns, seed, engine.spheres.fingerprint)
+        result = result_cache.get_or_compute(key, compute)
+    return {
+        'meeting_log': ColumnarMeetingLog.from_columns(result['meeting_log']),
+        'analytics': result['analytics']
+    }
+
+def parse_seed(value) -> Optional[int]:
+    """A request's meeting seed: None or a non-negative int, else ValueError"""
+    if value is None:
+        return None
+    # bool is an int subclass, but true/false is not a seed
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"seed must be a non-negative integer, got {value!r}")
+    return value
+
+def sse(event: str, data) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
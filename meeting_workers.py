@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Multi-process meeting execution
+Spreads template-mode meetings across CPU cores
+
+Every worker builds its simulator (sphere matrices, response bank) once at
+startup and is seeded deterministically from its worker index. Results come
+back as compact pre-encoded JSON, so the parent never re-serializes them and
+the web endpoint can send the bytes as-is.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Iterator, List, Optional, Sequence
+
+from balls_engine import SphereConfigFile
+from office_meeting_simulator import OfficeMeetingSimulator
+
+# Per-process state, set up by _init_worker
+_simulator: Optional[OfficeMeetingSimulator] = None
+_sphere_config: Optional[SphereConfigFile] = None
+
+def _init_worker(characters: Optional[List[str]], base_seed: Optional[int], counter,
+                 sphere_config: Optional[str] = None):
+    """Warm a worker: build its simulator, silence transcripts, seed its RNGs"""
+    global _simulator, _sphere_config
+    with counter.get_lock():
+        worker_index = counter.value
+        counter.value += 1
+    
+    sys.stdout = open(os.devnull, 'w')
+    # Each worker gets its own deterministic stream family
+    seed = None if base_seed is None else [base_seed, worker_index]
+    _sphere_config = SphereConfigFile(sphere_config) if sphere_config else None
+    _simulator = OfficeMeetingSimulator(
+        characters, seed, spheres=_sphere_config.registry if _sphere_config else None
+    )
+
+def _run_meeting(topic: str, max_turns: int, seed: Optional[int], columnar: bool = False) -> bytes:
+    """
+    Run one meeting in a worker and return it as compact JSON
+    A per-meeting seed makes the result independent of which worker ran it.
+    With columnar, the log is written in ColumnarMeetingLog.to_columns form.
+    """
+    if _sphere_config:
+        _sphere_config.poll(_simulator.reload_spheres)
+    if columnar:
+        session = _simulator.run_meeting(topic, max_turns, seed)
+        result = {'meeting_log': session.meeting_log.to_columns(), 'analytics': session.analytics.snapshot()}
+    else:
+        result = _simulator.meeting_result(topic, max_turns, seed)
+    return json.dumps({**result, 'success': True}, separators=(',', ':')).encode('utf-8')
+
+def _run_meeting_args(args) -> bytes:
+    return _run_meeting(*args)
+
+class MeetingProcessPool:
+    """Process pool that runs OfficeMeetingSimulator meetings on every core"""
+    
+    def __init__(self, processes: int = None, characters: List[str] = None, seed: int = None,
+                 sphere_config: str = None):
+        self.processes = processes or os.cpu_count() or 1
+        # Workers start (and warm up) immediately rather than on first use;
+        # each one re-reads sphere_config when the file changes
+        self._pool = multiprocessing.Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(characters, seed, multiprocessing.Value('i', 0), sphere_config)
+        )
+    
+    def run_meeting(self, topic: str, max_turns: int = 15, seed: int = None, columnar: bool = False) -> bytes:
+        """Run one meeting on a worker and wait for its encoded result"""
+        return self._pool.apply_async(_run_meeting, (topic, max_turns, seed, columnar)).get()
+    
+    def map_meetings(self, topics: Sequence[str], max_turns: int = 15, seeds: Sequence[int] = None,
+                     chunksize: int = 16, columnar: bool = False) -> Iterator[bytes]:
+        """Run many meetings, yielding encoded results in input order"""
+        if seeds is None:
+            seeds = [None] * len(topics)
+        tasks = [(topic, max_turns, seed, columnar) for topic, seed in zip(topics, seeds)]
+        return self._pool.imap(_run_meeting_args, tasks, chunksize=chunksize)
+    
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Office meetings in bulk across processes")
+    parser.add_argument("--topics_file", help="One meeting topic per line (default: the demo topics)")
+    parser.add_argument("--meetings", type=int, default=1000, help="Total meetings, cycling through topics")
+    parser.add_argument("--max_turns", type=int, default=15)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None, help="Base seed; meeting i uses seed + i")
+    parser.add_argument("--output", default="meeting_results.jsonl")
+    parser.add_argument("--sphere_config", help="JSON sphere config (see balls_engine.py --dump-config)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Archive meeting logs in columnar form (see meeting_log.py)")
+    args = parser.parse_args()
+    
+    if args.topics_file:
+        with open(args.topics_file, 'r', encoding='utf-8') as f:
+            topics = [line.strip() for line in f if line.strip()]
+    else:
+        from meeting_service import DEMO_TOPICS
+        topics = DEMO_TOPICS
+    
+    meeting_topics = [topics[i % len(topics)] for i in range(args.meetings)]
+    seeds = None if args.seed is None else [args.seed + i for i in range(args.meetings)]
+    
+    start = time.perf_counter()
+    with MeetingProcessPool(args.processes, seed=args.seed, sphere_config=args.sphere_config) as pool, open(args.output, 'wb') as f:
+        print(f"🏭 Running {args.meetings} meetings on {pool.processes} processes...")
+        for result in pool.map_meetings(meeting_topics, args.max_turns, seeds, columnar=args.columnar):
+            f.write(result + b'\n')
+    elapsed = time.perf_counter() - start
+    
+    print(f"✅ {args.meetings} meetings in {elapsed:.1f}s ({args.meetings / elapsed:.0f} meetings/s) -> {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -10,69 +10,91 @@ meets trained character LoRAs for authentic Office chaos.
 import asyncio
 import json
 import random
-from typing import Dict, List, Optional
-from balls_engine import BALLSEngine, CHARACTER_SPHERES, TopicType
-from dataclasses import dataclass
+import re
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from balls_engine import BALLSEngine, SphereRegistry, TOPIC_INDEX, TopicType, check_roster_coverage
+from meeting_cache import MeetingResultCache
+from meeting_log import ColumnarMeetingLog
+from collections import defaultdict
+from dataclasses import dataclass, field
+import numpy as np
 
-@dataclass 
-class CharacterModel:
-    """Placeholder for actual LoRA model integration"""
-    name: str
-    model_path: str = None
-    used_responses: List[str] = None
+@dataclass(frozen=True)
+class ResponseBucket:
+    """A trigger plus the canned responses it unlocks; no trigger means default"""
+    responses: Tuple[str, ...]
+    keywords: Tuple[str, ...] = ()
+    predicate: Optional[Callable[[List], bool]] = None
     
     def __post_init__(self):
-        if self.used_responses is None:
-            self.used_responses = []
+        # Substring matcher compiled once, same semantics as `word in text`
+        pattern = re.compile('|'.join(map(re.escape, self.keywords))) if self.keywords else None
+        object.__setattr__(self, '_pattern', pattern)
     
-    def generate_response(self, prompt: str, context: List[str] = None) -> str:
-        """
-        Generate character response using trained LoRA
-        Enhanced with topic-aware responses and massive variety
-        """
-        # Analyze topic for context-aware responses
-        topic_lower = prompt.lower()
-        context_str = " ".join(context) if context else ""
-        combined_text = (topic_lower + " " + context_str).lower()
-        
-        # Check for specific character mentions or reactions
-        has_michael_mention = 'michael' in combined_text
-        has_dwight_mention = 'dwight' in combined_text  
-        has_creed_mention = 'creed' in combined_text
-        has_that_what_she_said = 'that\'s what she said' in context_str or 'thats what she said' in context_str
-        
-        if self.name == 'Michael':
+    def matches(self, combined_text: str, context: List) -> bool:
+        if self._pattern is not None:
+            return self._pattern.search(combined_text) is not None
+        if self.predicate is not None:
+            return self.predicate(context)
+        return True
+
+@dataclass(frozen=True)
+class CharacterResponses:
+    """Ordered response buckets for one character, first match wins"""
+    buckets: Tuple[ResponseBucket, ...]
+    fallback: Tuple[str, ...] = ()
+    
+    def select_bucket(self, combined_text: str, context: List) -> ResponseBucket:
+        for bucket in self.buckets:
+            if bucket.matches(combined_text, context):
+                return bucket
+        return self.buckets[-1]
+
+def _michael_in_context(context: List) -> bool:
+    return any(entry.get('speaker') == 'Michael' for entry in context or [] if isinstance(entry, dict))
+
+# Response bank built once at import: per-character, per-trigger buckets
+RESPONSE_BANK = {
+    'Michael': CharacterResponses(
+        buckets=(
             # React to other characters
-            if has_dwight_mention:
-                responses = [
+            ResponseBucket(
+                keywords=('dwight',),
+                responses=(
                     "Dwight, you ignorant slut!",
                     "That's my right-hand man right there.",
                     "Dwight knows what he's talking about. Sometimes.",
-                    "FALSE! ...wait, that's Dwight's thing."
-                ]
+                    "FALSE! ...wait, that's Dwight's thing.",
+                )
+            ),
             # Management/Business responses
-            elif any(word in combined_text for word in ['sales', 'target', 'business', 'corporate', 'meeting']):
-                responses = [
+            ResponseBucket(
+                keywords=('sales', 'target', 'business', 'corporate', 'meeting'),
+                responses=(
                     "I am a great boss. I'm like a friend first, boss second, and probably entertainer third.",
                     "Sometimes I'll start a sentence and I don't even know where it's going. I just hope I find it along the way.",
                     "I would say I kind of have an unfair advantage because I watch reality dating shows like a hawk.",
                     "The worst thing about prison was the... was the Dementors. They were flying all over the place and they were scary.",
                     "Would I rather be feared or loved? Easy. Both. I want people to be afraid of how much they love me.",
                     "I'm not a millionaire. I thought I would be by the time I was 30, but I wasn't even close.",
-                    "I'm running away from my responsibilities. And it feels good."
-                ]
+                    "I'm running away from my responsibilities. And it feels good.",
+                )
+            ),
             # HR/Policy responses (he avoids these)
-            elif any(word in combined_text for word in ['hr', 'policy', 'complaint', 'harassment']):
-                responses = [
+            ResponseBucket(
+                keywords=('hr', 'policy', 'complaint', 'harassment'),
+                responses=(
                     "I'm not great at the advice. Can I interest you in a sarcastic comment?",
                     "I don't hate it. I just don't like it at all and it's terrible.",
                     "That's not what she said... or is it?",
                     "I think there's been a misunderstanding. I didn't do anything wrong... allegedly.",
-                    "Toby is in HR which technically means he works for corporate, so he's not really a part of our family."
-                ]
+                    "Toby is in HR which technically means he works for corporate, so he's not really a part of our family.",
+                )
+            ),
             # General Michael chaos
-            else:
-                responses = [
+            ResponseBucket(
+                responses=(
                     "That's what she said!",
                     "I'm not superstitious, but I am a little stitious.",
                     "You know what they say. Fool me once, strike one, but fool me twice... strike three.",
@@ -82,29 +104,47 @@ class CharacterModel:
                     "I'm not usually the butt of the joke. I'm usually the face of the joke.",
                     "Abraham Lincoln once said that 'If you're a racist, I will attack you with the North.'",
                     "Wikipedia is the best thing ever. Anyone in the world can write anything they want about any subject.",
-                    "I enjoy having breakfast in bed. I like waking up to the smell of bacon, sue me."
-                ]
-                
-        elif self.name == 'Dwight':
+                    "I enjoy having breakfast in bed. I like waking up to the smell of bacon, sue me.",
+                )
+            )
+        ),
+        # Fallback pool once every bucket response has been used
+        fallback=(
+            "I am a great boss. I'm like a friend first, boss second, and probably entertainer third.",
+            "Sometimes I'll start a sentence and I don't even know where it's going. I just hope I find it along the way.",
+            "That's what she said!",
+            "I DECLARE BANKRUPTCY!",
+            "Would I rather be feared or loved? Easy. Both. I want people to be afraid of how much they love me.",
+            "I love inside jokes. I'd love to be a part of one someday.",
+            "I'm not superstitious, but I am a little stitious.",
+        )
+    ),
+    'Dwight': CharacterResponses(
+        buckets=(
             # React to Michael
-            if has_michael_mention or 'boss' in combined_text:
-                responses = [
+            ResponseBucket(
+                keywords=('michael', 'boss'),
+                responses=(
                     "Michael is the best boss I've ever worked for!",
                     "MICHAEL! MICHAEL!",
                     "That's what I'm talking about!",
-                    "As Assistant Regional Manager, I agree completely."
-                ]
+                    "As Assistant Regional Manager, I agree completely.",
+                )
+            ),
             # React to "FALSE" situations
-            elif any(word in combined_text for word in ['wrong', 'incorrect', 'false', 'mistake']):
-                responses = [
+            ResponseBucket(
+                keywords=('wrong', 'incorrect', 'false', 'mistake'),
+                responses=(
                     "FALSE!",
                     "That is factually incorrect!",
                     "WRONG! So wrong it hurts!",
-                    "FALSE! Black bears are best!"
-                ]
+                    "FALSE! Black bears are best!",
+                )
+            ),
             # Survival/Beets/Farming
-            elif any(word in combined_text for word in ['beet', 'farm', 'survive', 'attack', 'security', 'fight']):
-                responses = [
+            ResponseBucket(
+                keywords=('beet', 'farm', 'survive', 'attack', 'security', 'fight'),
+                responses=(
                     "Bears. Beets. Battlestar Galactica.",
                     "I am faster than 80% of all snakes.",
                     "I can raise and lower my cholesterol at will.",
@@ -114,21 +154,24 @@ class CharacterModel:
                     "I don't have a lot of experience with vampires, but I have hunted werewolves. I shot one once, but by the time I got to it, it had turned back into my neighbor's dog.",
                     "I am ready to face any challenges that might be foolish enough to face me.",
                     "In the wild, there is no healthcare. In the wild, healthcare is 'Ow, I hurt my leg. I can't run. A lion eats me and I'm dead.'",
-                    "I have bear spray. And I've tested it on bears. It doesn't work."
-                ]
+                    "I have bear spray. And I've tested it on bears. It doesn't work.",
+                )
+            ),
             # Management/Authority (suck-up mode)
-            elif any(word in combined_text for word in ['manage', 'boss', 'authority', 'corporate']):
-                responses = [
+            ResponseBucket(
+                keywords=('manage', 'boss', 'authority', 'corporate'),
+                responses=(
                     "Michael is the best boss I've ever worked for. Also the only boss I've ever worked for.",
                     "I would follow Michael Scott to the ends of the earth. And I would do it willingly.",
                     "As Assistant Regional Manager, I can handle this situation.",
                     "Actually, it's Assistant TO the Regional Manager.",
                     "I have been given more responsibility and I intend to use it wisely.",
-                    "I'm an early bird and I'm a night owl. So I'm wise and I have worms."
-                ]
+                    "I'm an early bird and I'm a night owl. So I'm wise and I have worms.",
+                )
+            ),
             # General Dwight intensity
-            else:
-                responses = [
+            ResponseBucket(
+                responses=(
                     "FALSE!",
                     "Fact: Bears eat beets. Bears. Beets. Battlestar Galactica.",
                     "Identity theft is not a joke, Jim! Millions of families suffer every year!",
@@ -138,13 +181,25 @@ class CharacterModel:
                     "I never smile if I can help it. Showing one's teeth is a submission signal in primates.",
                     "I signed up for Second Life about a year ago. Back then my life was so great that I literally wanted a second one.",
                     "Dwight Schrute does not do anything small.",
-                    "I grew up on a farm. I have seen animals having sex in every position imaginable."
-                ]
-                
-        elif self.name == 'Creed':
+                    "I grew up on a farm. I have seen animals having sex in every position imaginable.",
+                )
+            )
+        ),
+        # Fallback pool once every bucket response has been used
+        fallback=(
+            "FALSE!",
+            "Bears. Beets. Battlestar Galactica.",
+            "Michael! MICHAEL!",
+            "Identity theft is not a joke, Jim! Millions of families suffer every year!",
+            "I am faster than 80% of all snakes.",
+        )
+    ),
+    'Creed': CharacterResponses(
+        buckets=(
             # Conspiracy/Random chaos
-            if any(word in combined_text for word in ['government', 'conspiracy', 'secret', 'steal', 'money']):
-                responses = [
+            ResponseBucket(
+                keywords=('government', 'conspiracy', 'secret', 'steal', 'money'),
+                responses=(
                     "I've been involved in a number of cults both as a leader and a follower.",
                     "Nobody steals from Creed Bratton and gets away with it. The last person to do this disappeared.",
                     "The Taliban is the worst. Great heroin though.",
@@ -153,11 +208,12 @@ class CharacterModel:
                     "Two eyes, two ears, a chin, a mouth, 10 fingers, two nipples, a butt, two kneecaps, a penis. I have just described to you the Loch Ness Monster.",
                     "I want to set you up with my daughter.",
                     "I know exactly what he's talking about. I sprout mung beans on a damp paper towel in my desk drawer.",
-                    "You're paying way too much for worms, man. Who's your worm guy?"
-                ]
+                    "You're paying way too much for worms, man. Who's your worm guy?",
+                )
+            ),
             # General Creed randomness
-            else:
-                responses = [
+            ResponseBucket(
+                responses=(
                     "Cool beans, man. I live by the quarry. We should hang out by the quarry and throw things down there!",
                     "I'm not offended by homosexuality. In the '60s, I made love to many, many women.",
                     "When Pam gets Michael's old chair, I get Pam's old chair. Then I'll have two chairs. Only one to go.",
@@ -167,13 +223,24 @@ class CharacterModel:
                     "I steal things all the time. It's just something I do. I stopped caring a long time ago.",
                     "Find out what language this is: *makes incomprehensible sounds*",
                     "I'm thirty. Well, in November I'll be thirty.",
-                    "Strike, scream, and run."
-                ]
-                
-        elif self.name == 'Erin':
+                    "Strike, scream, and run.",
+                )
+            )
+        ),
+        # Fallback pool once every bucket response has been used
+        fallback=(
+            "I've been involved in a number of cults both as a leader and a follower.",
+            "Nobody steals from Creed Bratton and gets away with it. The last person to do this disappeared.",
+            "Strike, scream, and run.",
+            "Cool beans, man. I live by the quarry. We should hang out by the quarry and throw things down there!",
+        )
+    ),
+    'Erin': CharacterResponses(
+        buckets=(
             # Confusion/Questions
-            if any(word in combined_text for word in ['understand', 'confused', 'complicated', 'explain']):
-                responses = [
+            ResponseBucket(
+                keywords=('understand', 'confused', 'complicated', 'explain'),
+                responses=(
                     "I'm sorry, what?",
                     "That sounds really complicated.",
                     "I think I understand... no, wait, I don't.",
@@ -183,11 +250,12 @@ class CharacterModel:
                     "Is that a good thing or a bad thing?",
                     "I'm confused. Are we supposed to be doing something?",
                     "Wait, what are we talking about again?",
-                    "I feel like I missed something important."
-                ]
-            # Innocent/Sweet responses  
-            else:
-                responses = [
+                    "I feel like I missed something important.",
+                )
+            ),
+            # Innocent/Sweet responses
+            ResponseBucket(
+                responses=(
                     "Oh, I don't know about that...",
                     "That's so nice!",
                     "I like your confidence.",
@@ -201,13 +269,24 @@ class CharacterModel:
                     "I don't want to say the wrong thing.",
                     "Maybe we should ask someone who knows more about this?",
                     "I hope I'm not being too forward, but that sounds great!",
-                    "Disposable cameras are fun, although it does seem wasteful."
-                ]
-                
-        elif self.name == 'Toby':
+                    "Disposable cameras are fun, although it does seem wasteful.",
+                )
+            )
+        ),
+        # Fallback pool once every bucket response has been used
+        fallback=(
+            "I'm sorry, what?",
+            "That sounds really complicated.",
+            "Oh, I don't know about that...",
+            "That's so nice!",
+        )
+    ),
+    'Toby': CharacterResponses(
+        buckets=(
             # HR/Policy (his domain)
-            if any(word in combined_text for word in ['policy', 'hr', 'complaint', 'harassment', 'legal']):
-                responses = [
+            ResponseBucket(
+                keywords=('policy', 'hr', 'complaint', 'harassment', 'legal'),
+                responses=(
                     "Actually, according to company policy...",
                     "We need to be careful about liability issues.",
                     "I should probably document this conversation.",
@@ -217,11 +296,13 @@ class CharacterModel:
                     "I'm going to have to report this to corporate.",
                     "We should probably have a formal meeting about this.",
                     "I need to make sure everyone understands the policy.",
-                    "This is why we have training sessions."
-                ]
+                    "This is why we have training sessions.",
+                )
+            ),
             # Michael present (defeated)
-            elif any(entry.get('speaker') == 'Michael' for entry in context if isinstance(entry, dict)):
-                responses = [
+            ResponseBucket(
+                predicate=_michael_in_context,
+                responses=(
                     "Michael, please...",
                     "That's not appropriate...",
                     "I don't think that's a good idea.",
@@ -231,11 +312,12 @@ class CharacterModel:
                     "Michael, we've discussed this before.",
                     "I don't think corporate would approve of that.",
                     "Can we please be professional?",
-                    "I'm going to have to ask you to stop."
-                ]
+                    "I'm going to have to ask you to stop.",
+                )
+            ),
             # General defeated Toby
-            else:
-                responses = [
+            ResponseBucket(
+                responses=(
                     "I'm just trying to do my job here.",
                     "I don't think that's appropriate...",
                     "Has anyone seen my desk?",
@@ -245,133 +327,309 @@ class CharacterModel:
                     "I hate so much about the things that you choose to be.",
                     "Smile if you love men's prostates!",
                     "I'm going to kill myself. I'm going to kill myself and it's your fault.",
-                    "If I had a gun with two bullets and I was in a room with Hitler, Bin Laden, and Toby, I would shoot Toby twice."
-                ]
-        else:
-            responses = ["I don't know what to say."]
+                    "If I had a gun with two bullets and I was in a room with Hitler, Bin Laden, and Toby, I would shoot Toby twice.",
+                )
+            )
+        ),
+        # Fallback pool once every bucket response has been used
+        fallback=(
+            "Actually, according to company policy...",
+            "Michael, please...",
+            "I'm just trying to do my job here.",
+            "I don't think that's appropriate...",
+        )
+    )
+}
+
+DEFAULT_RESPONSES = CharacterResponses(
+    buckets=(ResponseBucket(responses=("I don't know what to say.",)),)
+)
+
+@dataclass 
+class CharacterModel:
+    """Placeholder for actual LoRA model integration"""
+    name: str
+    model_path: str = None
+    used_responses: Set[str] = None
+    
+    def __post_init__(self):
+        if self.used_responses is None:
+            self.used_responses = set()
+        self.response_bank = RESPONSE_BANK.get(self.name, DEFAULT_RESPONSES)
+    
+    def generate_response(self, prompt: str, context: List[str] = None, used_responses: Set[str] = None,
+                          rng: np.random.Generator = None) -> str:
+        """
+        Generate character response using trained LoRA
+        Enhanced with topic-aware responses and massive variety
+        Repeats are tracked in used_responses when given (one set per meeting),
+        otherwise in this model's own used_responses. Picks are drawn from rng
+        when given, otherwise from the global random module.
+        """
+        # Analyze topic for context-aware responses
+        context_str = " ".join(context) if context else ""
+        combined_text = (prompt + " " + context_str).lower()
+        
+        responses = self.response_bank.select_bucket(combined_text, context).responses
         
         # Filter out responses we've already used in this meeting
-        available_responses = [r for r in responses if r not in self.used_responses]
+        used = self.used_responses if used_responses is None else used_responses
+        available_responses = [r for r in responses if r not in used]
         
         # If we've used all responses from this category, still prevent global repeats
         if not available_responses:
-            # Find any responses that haven't been used at all this meeting
-            all_possible_responses = []
-            
-            # Collect all possible responses for this character (simplified)
-            if self.name == 'Michael':
-                all_possible_responses = [
-                    "I am a great boss. I'm like a friend first, boss second, and probably entertainer third.",
-                    "Sometimes I'll start a sentence and I don't even know where it's going. I just hope I find it along the way.",
-                    "That's what she said!",
-                    "I DECLARE BANKRUPTCY!",
-                    "Would I rather be feared or loved? Easy. Both. I want people to be afraid of how much they love me.",
-                    "I love inside jokes. I'd love to be a part of one someday.",
-                    "I'm not superstitious, but I am a little stitious."
-                ]
-            elif self.name == 'Dwight':
-                all_possible_responses = [
-                    "FALSE!",
-                    "Bears. Beets. Battlestar Galactica.",
-                    "Michael! MICHAEL!",
-                    "Identity theft is not a joke, Jim! Millions of families suffer every year!",
-                    "I am faster than 80% of all snakes."
-                ]
-            elif self.name == 'Creed':
-                all_possible_responses = [
-                    "I've been involved in a number of cults both as a leader and a follower.",
-                    "Nobody steals from Creed Bratton and gets away with it. The last person to do this disappeared.",
-                    "Strike, scream, and run.",
-                    "Cool beans, man. I live by the quarry. We should hang out by the quarry and throw things down there!"
-                ]
-            elif self.name == 'Erin':
-                all_possible_responses = [
-                    "I'm sorry, what?",
-                    "That sounds really complicated.",
-                    "Oh, I don't know about that...",
-                    "That's so nice!"
-                ]
-            elif self.name == 'Toby':
-                all_possible_responses = [
-                    "Actually, according to company policy...",
-                    "Michael, please...",
-                    "I'm just trying to do my job here.",
-                    "I don't think that's appropriate..."
-                ]
-            else:
-                all_possible_responses = responses
-            
-            # Find unused responses
-            available_responses = [r for r in all_possible_responses if r not in self.used_responses]
+            fallback = self.response_bank.fallback or responses
+            available_responses = [r for r in fallback if r not in used]
             
             # If still nothing, reset completely
             if not available_responses:
-                self.used_responses = []
-                available_responses = responses
+                used.clear()
+                available_responses = list(responses)
         
         # Select response and track it
-        selected_response = random.choice(available_responses)
-        self.used_responses.append(selected_response)
+        if rng is not None:
+            selected_response = available_responses[rng.integers(len(available_responses))]
+        else:
+            selected_response = random.choice(available_responses)
+        used.add(selected_response)
         
         return selected_response
 
+class MeetingAnalytics:
+    """
+    Running BALLS analytics for one meeting
+    Counters and sums are updated as each log entry is added, so a snapshot
+    is available mid-meeting without rescanning the log
+    """
+    
+    # Michael and Toby within this many turns of each other count as an interaction
+    INTERACTION_WINDOW = 2
+    
+    def __init__(self, characters: List[str]):
+        self.characters = list(characters)
+        self.entries = 0
+        self.turns = dict.fromkeys(self.characters, 0)
+        self.radius_sums = np.zeros(len(self.characters))
+        self.probability_sums = np.zeros(len(self.characters))
+        self.topic_evolution = []
+        self.michael_toby_interactions = 0
+        self._recent_speakers = []  # Last INTERACTION_WINDOW speakers
+    
+    def add_turn(self, speaker: str, topic_type: str, radii: np.ndarray = None, probabilities: np.ndarray = None):
+        """Fold one turn into the running totals; radii and probabilities are in roster order"""
+        self.entries += 1
+        if speaker in self.turns:
+            self.turns[speaker] += 1
+        
+        if radii is not None:
+            self.radius_sums += radii
+            self.probability_sums += probabilities
+        
+        if topic_type is not None:
+            self.topic_evolution.append(topic_type)
+        
+        # Pair this speaker with any counterpart in the trailing window
+        counterpart = {'Michael': 'Toby', 'Toby': 'Michael'}.get(speaker)
+        if counterpart is not None:
+            self.michael_toby_interactions += self._recent_speakers.count(counterpart)
+        self._recent_speakers.append(speaker)
+        if len(self._recent_speakers) > self.INTERACTION_WINDOW:
+            self._recent_speakers.pop(0)
+    
+    def add(self, entry: Dict):
+        """Fold one legacy meeting log entry into the running totals"""
+        spheres = entry.get('sphere_analysis')
+        radii = probabilities = None
+        if spheres is not None:
+            # Back to the float32 the log stores, so a replay matches the live totals
+            radii = np.array([spheres[char]['radius'] for char in self.characters], dtype=np.float32)
+            probabilities = np.array([spheres[char]['probability'] for char in self.characters], dtype=np.float32)
+        self.add_turn(entry['speaker'], entry.get('topic_type'), radii, probabilities)
+    
+    def snapshot(self) -> Dict:
+        """Analytics for the entries added so far, shaped like analyze_meeting_dynamics"""
+        if not self.entries:
+            return {}
+        
+        total_turns = self.entries - 1  # Exclude moderator
+        return {
+            'total_turns': total_turns,
+            'speaker_distribution': {
+                char: {
+                    'turns': self.turns[char],
+                    'percentage': self.turns[char] / max(total_turns, 1) * 100,
+                    'avg_sphere_size': float(self.radius_sums[i] / self.entries),
+                    'avg_probability': float(self.probability_sums[i] / self.entries)
+                } for i, char in enumerate(self.characters)
+            },
+            'topic_evolution': list(self.topic_evolution),
+            'sphere_dominance': {},
+            'michael_toby_interactions': self.michael_toby_interactions
+        }
+
+@dataclass
+class MeetingSession:
+    """
+    Mutable state of a single meeting. The sphere matrices and response bank
+    it runs against are shared and read-only, so sessions are cheap to create
+    and safe to run side by side.
+    """
+    topic: str
+    max_turns: int = 15
+    meeting_log: Optional[ColumnarMeetingLog] = None
+    used_responses: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    rng: np.random.Generator = field(default_factory=np.random.default_rng)
+    analytics: Optional[MeetingAnalytics] = None
+    
+    def add_turn(self, turn: int, speaker: str, message: str, topic_type: TopicType,
+                 radii: np.ndarray, probabilities: np.ndarray):
+        """Append to the meeting log and update the running analytics"""
+        self.meeting_log.append(turn, speaker, message, topic_type, radii, probabilities)
+        # Totals come from the stored float32 row, so they agree with any replay of the log
+        self.analytics.add_turn(speaker, topic_type.value, self.meeting_log.radii[-1],
+                                self.meeting_log.probabilities[-1])
+
 class OfficeMeetingSimulator:
     """
     Full Office meeting simulation with BALLS dynamics
     Orchestrates character interactions using sphere mathematics
     """
     
-    def __init__(self, characters: List[str] = None):
+    def __init__(self, characters: List[str] = None, seed=None, result_cache: MeetingResultCache = None,
+                 spheres: SphereRegistry = None):
         if characters is None:
-            characters = ['Michael', 'Dwight', 'Creed', 'Erin', 'Toby']
+            characters = list(spheres) if spheres is not None else ['Michael', 'Dwight', 'Creed', 'Erin', 'Toby']
             
-        self.balls_engine = BALLSEngine(characters)
+        self.balls_engine = BALLSEngine(characters, seed, spheres)
         self.character_models = {
             name: CharacterModel(name) for name in characters
         }
         self.meeting_log = []
         
-    def start_meeting(self, topic: str, max_turns: int = 15) -> List[Dict]:
+        # Unseeded meetings get independent child streams of this sequence
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._seed_lock = threading.Lock()
+        
+        # Seeded meetings replay identically, so their results can be memoized
+        self.result_cache = result_cache
+        
+    def reload_spheres(self, spheres: SphereRegistry):
+        """
+        Switch to a new sphere configuration for the same roster
+        Meetings already running keep the engine they started with; the swap
+        is a single reference assignment, so new meetings see old or new
+        parameters but never a mix. Raises SphereConfigError, keeping the
+        current engine, if spheres leaves out a roster member.
+        """
+        check_roster_coverage(spheres, self.balls_engine.active_characters)
+        engine = BALLSEngine(self.balls_engine.active_characters, spheres=spheres)
+        engine.rng = self.balls_engine.rng
+        self.balls_engine = engine
+        
+    def new_session(self, topic: str, max_turns: int = 15, seed=None) -> MeetingSession:
+        """
+        Create a meeting session with its own random stream
+        The same (topic, seed) always replays the same meeting
+        """
+        if seed is None:
+            with self._seed_lock:
+                seed = self._seed_sequence.spawn(1)[0]
+        return MeetingSession(topic, max_turns, rng=np.random.default_rng(seed))
+        
+    def start_meeting(self, topic: str, max_turns: int = 15, seed=None) -> List[Dict]:
         """
         Start an Office meeting simulation
         Returns full conversation log with BALLS analytics
         """
-        # Reset used responses for new meeting
-        for character_model in self.character_models.values():
-            character_model.used_responses = []
+        if seed is not None and self.result_cache is not None:
+            self.meeting_log = self.meeting_result(topic, max_turns, seed)['meeting_log']
+            return self.meeting_log
+        session = self.run_meeting(topic, max_turns, seed)
+        self.meeting_log = session.meeting_log.to_dicts()
+        return self.meeting_log
+    
+    def meeting_result(self, topic: str, max_turns: int = 15, seed=None, columnar: bool = False) -> Dict:
+        """
+        Meeting log plus analytics for one meeting
+        The log is a ColumnarMeetingLog when columnar is set, else legacy dicts.
+        Seeded meetings are served from result_cache when one is configured;
+        it holds the compact to_columns form and analytics are shared, so
+        treat them as read-only
+        """
+        if seed is None or self.result_cache is None:
+            session = self.run_meeting(topic, max_turns, seed)
+            meeting_log, analytics = session.meeting_log, session.analytics.snapshot()
+        else:
+            def compute():
+                session = self.run_meeting(topic, max_turns, seed)
+                return {
+                    'meeting_log': session.meeting_log.to_columns(),
+                    'analytics': session.analytics.snapshot()
+                }
+            
+            engine = self.balls_engine
+            key = self.result_cache.key(topic, engine.active_characters, max_turns, seed, engine.spheres.fingerprint)
+            cached = self.result_cache.get_or_compute(key, compute)
+            meeting_log = ColumnarMeetingLog.from_columns(cached['meeting_log'])
+            analytics = cached['analytics']
+        
+        return {
+            'meeting_log': meeting_log if columnar else meeting_log.to_dicts(),
+            'analytics': analytics
+        }
+    
+    def run_meeting(self, topic: str, max_turns: int = 15, seed=None) -> MeetingSession:
+        """Run a meeting in its own session without touching simulator state"""
+        session = self.new_session(topic, max_turns, seed)
+        for _ in self._play_meeting(topic, max_turns, session):
+            pass
+        return session
+    
+    def stream_meeting(self, topic: str, max_turns: int = 15, session: MeetingSession = None) -> Iterator[Dict]:
+        """
+        Run an Office meeting simulation turn by turn
+        Yields a 'turn' event per log entry as soon as it exists, then
+        'meeting_end' with the full conversation log. All meeting state lives
+        in the session, so concurrent meetings on one simulator stay isolated.
+        """
+        if session is None:
+            session = self.new_session(topic, max_turns)
+        for index in self._play_meeting(topic, max_turns, session):
+            yield {'event': 'turn', 'entry': session.meeting_log.entry(index)}
+        yield {'event': 'meeting_end', 'meeting_log': session.meeting_log}
+    
+    def _play_meeting(self, topic: str, max_turns: int, session: MeetingSession) -> Iterator[int]:
+        """Run the meeting into the session's columnar log, yielding each new entry's index"""
+        engine = self.balls_engine
+        if session.meeting_log is None:
+            session.meeting_log = ColumnarMeetingLog(engine.active_characters, capacity=max_turns + 1)
+        if session.analytics is None:
+            session.analytics = MeetingAnalytics(engine.active_characters)
             
         print(f"\n🏢 === OFFICE MEETING STARTED ===")
         print(f"📋 Topic: {topic}")
-        print(f"👥 Attendees: {', '.join(self.balls_engine.active_characters)}")
+        print(f"👥 Attendees: {', '.join(engine.active_characters)}")
         
         # Analyze initial topic
-        topic_type = self.balls_engine.analyze_topic(topic)
+        topic_type = engine.analyze_topic(topic)
         print(f"📊 BALLS Topic Analysis: {topic_type.value}")
         
         # Show initial sphere sizes
-        probabilities = self.balls_engine.calculate_speaking_probabilities(topic_type)
+        probabilities = engine.calculate_speaking_probabilities(topic_type)
+        radii = engine.calculate_sphere_radii(topic_type)
         print(f"\n⚡ Initial Speaking Probabilities:")
         for char, prob in sorted(probabilities.items(), key=lambda x: x[1], reverse=True):
-            sphere = CHARACTER_SPHERES[char]
-            radius = sphere.calculate_radius(topic_type)
-            print(f"   {char}: {prob:.1%} (sphere: {radius:.2f})")
+            print(f"   {char}: {prob:.1%} (sphere: {radii[char]:.2f})")
         
         # Initialize meeting log
-        meeting_log = [{
-            'turn': 0,
-            'speaker': 'Moderator',
-            'message': topic,
-            'topic_type': topic_type.value,
-            'sphere_analysis': {
-                char: {
-                    'radius': CHARACTER_SPHERES[char].calculate_radius(topic_type),
-                    'probability': probabilities[char]
-                } for char in self.balls_engine.active_characters
-            }
-        }]
+        meeting_log = session.meeting_log
+        column = TOPIC_INDEX[topic_type]
+        session.add_turn(0, 'Moderator', topic, topic_type,
+                         engine.radius_matrix[:, column], engine.probability_matrix[:, column])
         
         print(f"\n💬 Meeting Transcript:")
         print(f"[Moderator]: {topic}")
+        yield len(meeting_log) - 1
         
         # Run meeting simulation
         last_speaker = None
@@ -379,38 +637,33 @@ class OfficeMeetingSimulator:
         for turn in range(1, max_turns + 1):
             # BALLS determines next speaker
             exclude = []
-            if last_speaker and CHARACTER_SPHERES[last_speaker].dominance_factor < 0.8:
+            if last_speaker and engine.spheres[last_speaker].dominance_factor < 0.8:
                 exclude = [last_speaker]
                 
-            next_speaker = self.balls_engine.select_next_speaker(topic, exclude)
+            next_speaker = engine.select_next_speaker(topic_type, exclude, session.rng)
             
             # Generate character response
-            context = [entry['message'] for entry in meeting_log[-3:]]  # Last 3 messages
-            response = self.character_models[next_speaker].generate_response(topic, context)
+            context = meeting_log.messages[-3:]  # Last 3 messages
+            response = self.character_models[next_speaker].generate_response(
+                topic, context, session.used_responses[next_speaker], session.rng
+            )
             
             # Update topic based on response (conversations can drift)
-            current_topic_type = self.balls_engine.analyze_topic(response)
-            current_probabilities = self.balls_engine.calculate_speaking_probabilities(current_topic_type)
+            current_topic_type = engine.analyze_topic(response)
+            column = TOPIC_INDEX[current_topic_type]
+            current_radii = engine.radius_matrix[:, column]
+            current_probabilities = engine.probability_matrix[:, column]
             
             # Log the turn
-            turn_data = {
-                'turn': turn,
-                'speaker': next_speaker,
-                'message': response,
-                'topic_type': current_topic_type.value,
-                'sphere_analysis': {
-                    char: {
-                        'radius': CHARACTER_SPHERES[char].calculate_radius(current_topic_type),
-                        'probability': current_probabilities[char]
-                    } for char in self.balls_engine.active_characters
-                }
-            }
-            meeting_log.append(turn_data)
+            session.add_turn(turn, next_speaker, response, current_topic_type,
+                             current_radii, current_probabilities)
             
             # Print the exchange
-            sphere_size = CHARACTER_SPHERES[next_speaker].calculate_radius(current_topic_type)
-            prob = current_probabilities[next_speaker]
+            speaker_index = engine.character_index[next_speaker]
+            sphere_size = current_radii[speaker_index]
+            prob = current_probabilities[speaker_index]
             print(f"[{next_speaker}] (⚡{prob:.1%}, 🔮{sphere_size:.2f}): {response}")
+            yield len(meeting_log) - 1
             
             last_speaker = next_speaker
             
@@ -420,45 +673,20 @@ class OfficeMeetingSimulator:
                 break
         
         print(f"\n🏁 === MEETING ENDED ===")
-        self.meeting_log = meeting_log
-        return meeting_log
     
-    def analyze_meeting_dynamics(self) -> Dict:
-        """Analyze the BALLS dynamics from the completed meeting"""
-        if not self.meeting_log:
-            return {}
-        
-        analysis = {
-            'total_turns': len(self.meeting_log) - 1,  # Exclude moderator
-            'speaker_distribution': {},
-            'topic_evolution': [],
-            'sphere_dominance': {},
-            'michael_toby_interactions': 0
-        }
-        
-        # Speaker distribution and sphere analysis
-        for char in self.balls_engine.active_characters:
-            turns = [entry for entry in self.meeting_log if entry['speaker'] == char]
-            analysis['speaker_distribution'][char] = {
-                'turns': len(turns),
-                'percentage': len(turns) / max(analysis['total_turns'], 1) * 100,
-                'avg_sphere_size': sum(entry['sphere_analysis'][char]['radius'] for entry in self.meeting_log if 'sphere_analysis' in entry) / len(self.meeting_log),
-                'avg_probability': sum(entry['sphere_analysis'][char]['probability'] for entry in self.meeting_log if 'sphere_analysis' in entry) / len(self.meeting_log)
-            }
-        
-        # Topic evolution
-        analysis['topic_evolution'] = [entry['topic_type'] for entry in self.meeting_log if 'topic_type' in entry]
-        
-        # Michael-Toby dynamics
-        michael_turns = [i for i, entry in enumerate(self.meeting_log) if entry['speaker'] == 'Michael']
-        toby_turns = [i for i, entry in enumerate(self.meeting_log) if entry['speaker'] == 'Toby']
-        
-        for m_turn in michael_turns:
-            for t_turn in toby_turns:
-                if abs(m_turn - t_turn) <= 2:  # Within 2 turns of each other
-                    analysis['michael_toby_interactions'] += 1
+    def analyze_meeting_dynamics(self, meeting_log: List[Dict] = None) -> Dict:
+        """
+        Analyze the BALLS dynamics from a completed meeting (default: the last one started)
+        Replays the log through a MeetingAnalytics in one pass; callers holding
+        the MeetingSession can read session.analytics.snapshot() instead
+        """
+        if meeting_log is None:
+            meeting_log = self.meeting_log
         
-        return analysis
+        analytics = MeetingAnalytics(self.balls_engine.active_characters)
+        for entry in meeting_log:
+            analytics.add(entry)
+        return analytics.snapshot()
     
     def print_analytics(self):
         """Print detailed BALLS analytics"""
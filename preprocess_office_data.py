@@ -2,12 +2,33 @@
 """
 The Office Character Data Preprocessor
 Extracts character-specific dialogues for BALLS-powered LoRA training
+
+--stream walks the corpus one episode at a time through a generator
+pipeline and writes training files as it goes, so memory stays flat no
+matter how large the transcript corpus is. --processes N shards episodes
+across worker processes instead; each shard writes its own per-character
+files, listed in order in a shards.json manifest. Lines are cleaned by a
+line_cleaning pipeline; --normalize_whitespace, --dedup, --min_chars and
+--max_chars add stages to it.
+
+Re-runs are incremental: preprocess_manifest.json records a content hash of
+each character's lines (or each shard's episodes) and of the files written
+from them, so only characters and shards whose data changed are rewritten.
+--force rebuilds everything.
 """
 
+import argparse
+import hashlib
 import json
+import multiprocessing
 import os
-from collections import defaultdict, Counter
-from typing import Dict, List, Tuple
+import shutil
+from collections import defaultdict, deque, Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from line_cleaning import DEFAULT_PIPELINE, CleaningPipeline, build_pipeline
+from stage_manifest import StageManifest, digest_files, digest_json
 
 # Our BALLS character roster
 TARGET_CHARACTERS = {
@@ -18,118 +39,340 @@ TARGET_CHARACTERS = {
     'Toby': ['Toby', 'Toby Flenderson']
 }
 
+# Variation -> roster name, so normalizing a speaker is one lookup
+_ROSTER_NAMES = {
+    variation: target for target, variations in TARGET_CHARACTERS.items() for variation in variations
+}
+
+@dataclass(frozen=True)
+class EpisodeInfo:
+    """Episode metadata, created once per episode and shared by all of its lines"""
+    season: int
+    episode: int
+    title: str
+
+class CharacterLine(NamedTuple):
+    """One roster character's line, pointing at its episode instead of copying it"""
+    character: str
+    line: str
+    episode: EpisodeInfo
+    scene_type: str  # 'regular' or 'deleted'
+
+class DialogueStats:
+    """Running line count, length and season spread for one character"""
+    
+    def __init__(self):
+        self.total_lines = 0
+        self.total_length = 0
+        self.season_counts = Counter()
+    
+    def add(self, line: CharacterLine):
+        self.total_lines += 1
+        self.total_length += len(line.line)
+        self.season_counts[line.episode.season] += 1
+    
+    def merge(self, other: 'DialogueStats'):
+        """Fold in stats for lines that come after this one's"""
+        self.total_lines += other.total_lines
+        self.total_length += other.total_length
+        self.season_counts.update(other.season_counts)
+    
+    def to_dict(self) -> Dict:
+        return {
+            'total_lines': self.total_lines,
+            'total_length': self.total_length,
+            'season_counts': list(self.season_counts.items())
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DialogueStats':
+        stats = cls()
+        stats.total_lines = data['total_lines']
+        stats.total_length = data['total_length']
+        stats.season_counts = Counter(dict(data['season_counts']))
+        return stats
+
 def load_office_data(filepath: str) -> List[Dict]:
     """Load The Office episode data"""
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def normalize_character_name(character: str) -> str:
+def iter_episodes(filepath: str, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    Stream episodes out of the corpus's top-level JSON array one at a time
+    Only the episode being decoded is held in memory, never the whole file
+    """
+    decoder = json.JSONDecoder()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        buffer, pos = '', 0
+        started = False
+        expect_value = True
+        
+        while True:
+            # Skip whitespace, reading on when the buffer runs dry
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                    pos += 1
+                if pos < len(buffer):
+                    break
+                buffer, pos = f.read(chunk_size), 0
+                if not buffer:
+                    raise ValueError(f"{filepath}: unexpected end of episode array")
+            
+            char = buffer[pos]
+            if not started:
+                if char != '[':
+                    raise ValueError(f"{filepath}: expected a JSON array of episodes")
+                started = True
+                pos += 1
+            elif char == ']':
+                return
+            elif not expect_value:
+                if char != ',':
+                    raise ValueError(f"{filepath}: expected ',' between episodes")
+                expect_value = True
+                pos += 1
+            else:
+                # Decode one episode, growing the window until it is complete
+                while True:
+                    try:
+                        episode, pos = decoder.raw_decode(buffer, pos)
+                        break
+                    except json.JSONDecodeError:
+                        more = f.read(max(chunk_size, len(buffer) - pos))
+                        if not more:
+                            raise
+                        buffer, pos = buffer[pos:] + more, 0
+                expect_value = False
+                yield episode
+
+def normalize_character_name(character: str) -> Optional[str]:
     """Normalize character names to match our BALLS roster"""
-    character = character.strip()
-    
-    for target, variations in TARGET_CHARACTERS.items():
-        if character in variations:
-            return target
-    
-    return None  # Ignore characters not in our roster
+    return _ROSTER_NAMES.get(character.strip())  # None for characters not in our roster
 
-def extract_character_lines(episodes: List[Dict]) -> Dict[str, List[str]]:
-    """Extract all lines for each target character"""
-    character_lines = defaultdict(list)
-    
+def iter_character_lines(episodes: Iterable[Dict]) -> Iterator[CharacterLine]:
+    """Roster characters' lines, episode by episode: regular scenes, then deleted ones"""
     for episode in episodes:
-        season = episode['season']
-        episode_num = episode['episode']
-        title = episode['title']
+        info = EpisodeInfo(episode['season'], episode['episode'], episode['title'])
         
-        # Process regular scenes
-        for scene in episode.get('scenes', []):
-            for line_data in scene:
-                character = normalize_character_name(line_data['character'])
-                if character:
-                    line = line_data['line']
-                    # Add context metadata
-                    character_lines[character].append({
-                        'line': line,
-                        'season': season,
-                        'episode': episode_num,
-                        'title': title,
-                        'scene_type': 'regular'
-                    })
-        
-        # Process deleted scenes
-        for scene in episode.get('deleted_scenes', []):
-            for line_data in scene:
-                character = normalize_character_name(line_data['character'])
-                if character:
-                    line = line_data['line']
-                    character_lines[character].append({
-                        'line': line,
-                        'season': season,
-                        'episode': episode_num,
-                        'title': title,
-                        'scene_type': 'deleted'
-                    })
-    
+        for scene_type, scenes_key in (('regular', 'scenes'), ('deleted', 'deleted_scenes')):
+            for scene in episode.get(scenes_key, []):
+                for line_data in scene:
+                    character = normalize_character_name(line_data['character'])
+                    if character:
+                        yield CharacterLine(character, line_data['line'], info, scene_type)
+
+def extract_character_lines(episodes: Iterable[Dict]) -> Dict[str, List[CharacterLine]]:
+    """Extract all lines for each target character"""
+    character_lines = defaultdict(list)
+    for line in iter_character_lines(episodes):
+        character_lines[line.character].append(line)
     return dict(character_lines)
 
-def format_for_training(character_lines: Dict[str, List[Dict]]) -> Dict[str, List[str]]:
+def format_training_line(character: str, line: str,
+                         pipeline: CleaningPipeline = DEFAULT_PIPELINE) -> Optional[str]:
+    """One cleaned training example, or None if nothing is left of the line"""
+    line = pipeline.clean_line(line)
+    return f"{character}: {line}" if line else None
+
+def format_for_training(character_lines: Dict[str, List[CharacterLine]],
+                        pipeline: CleaningPipeline = DEFAULT_PIPELINE) -> Dict[str, List[str]]:
     """Format character lines for LoRA training"""
     training_data = {}
     
     for character, lines in character_lines.items():
-        formatted_lines = []
-        
-        for line_data in lines:
-            line = line_data['line']
-            
-            # Clean up the line
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Remove stage directions in brackets
-            import re
-            line = re.sub(r'\[.*?\]', '', line).strip()
-            
-            if line:
-                # Format as training example
-                formatted_lines.append(f"{character}: {line}")
-        
-        training_data[character] = formatted_lines
+        cleaned = pipeline.cleaner().clean(line_data.line for line_data in lines)
+        training_data[character] = [f"{character}: {line}" for line in cleaned]
     
     return training_data
 
-def analyze_character_data(character_lines: Dict[str, List[Dict]]) -> None:
+def analyze_character_data(character_lines: Dict[str, List[CharacterLine]]) -> None:
     """Analyze character dialogue statistics"""
+    stats = {}
+    for character, lines in character_lines.items():
+        stats[character] = DialogueStats()
+        for line in lines:
+            stats[character].add(line)
+    print_character_stats(stats)
+
+def print_character_stats(stats: Dict[str, DialogueStats]) -> None:
+    """Print per-character dialogue statistics"""
     print("\n=== CHARACTER DIALOGUE ANALYSIS ===")
     
     for character in TARGET_CHARACTERS.keys():
-        lines = character_lines.get(character, [])
-        total_lines = len(lines)
+        character_stats = stats.get(character)
         
-        if total_lines == 0:
+        if character_stats is None or character_stats.total_lines == 0:
             print(f"{character}: NO LINES FOUND")
             continue
         
-        # Season distribution
-        season_counts = Counter(line['season'] for line in lines)
-        
-        # Average line length
-        line_lengths = [len(line['line']) for line in lines]
-        avg_length = sum(line_lengths) / len(line_lengths) if line_lengths else 0
+        avg_length = character_stats.total_length / character_stats.total_lines
         
         print(f"\n{character}:")
-        print(f"  Total lines: {total_lines}")
+        print(f"  Total lines: {character_stats.total_lines}")
         print(f"  Avg line length: {avg_length:.1f} chars")
-        print(f"  Season distribution: {dict(season_counts)}")
+        print(f"  Season distribution: {dict(character_stats.season_counts)}")
+
+def training_data_path(output_dir: str, character: str) -> str:
+    return f"{output_dir}/{character.lower()}_training_data.txt"
+
+SHARD_DIR = 'shards'
+SHARD_MANIFEST = 'shards.json'
+PREPROCESS_MANIFEST = 'preprocess_manifest.json'
+
+# Bump when extraction or the training file format changes, so every
+# manifest entry is rebuilt
+PREPROCESS_VERSION = 1
+
+def preprocess_manifest(output_dir: str, pipeline: CleaningPipeline = DEFAULT_PIPELINE) -> StageManifest:
+    """Build manifest for output_dir; entries made with other cleaning stages are stale"""
+    return StageManifest(os.path.join(output_dir, PREPROCESS_MANIFEST), 'preprocess',
+                         {'version': PREPROCESS_VERSION, 'pipeline': repr(pipeline)})
+
+def shard_path(output_dir: str, character: str, shard: int) -> str:
+    return f"{output_dir}/{SHARD_DIR}/{character.lower()}_training_data.{shard:05d}.txt"
+
+def training_files(output_dir: str) -> Dict[str, List[str]]:
+    """
+    Each character's training files in line order: the shards listed in the
+    manifest after a parallel run, otherwise the single per-character file
+    """
+    manifest_path = os.path.join(output_dir, SHARD_MANIFEST)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return {
+            character: [os.path.join(output_dir, name) for name in entry['files']]
+            for character, entry in manifest['characters'].items()
+        }
+    
+    files = {}
+    for filename in sorted(os.listdir(output_dir)):
+        if filename.endswith('_training_data.txt'):
+            character = filename.replace('_training_data.txt', '').capitalize()
+            files[character] = [os.path.join(output_dir, filename)]
+    return files
+
+def _clear_shards(output_dir: str) -> None:
+    """Drop a previous parallel run's shards so they can't shadow fresh output"""
+    manifest_path = os.path.join(output_dir, SHARD_MANIFEST)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    shutil.rmtree(os.path.join(output_dir, SHARD_DIR), ignore_errors=True)
+
+class _TrainingWriters:
+    """Per-character output files, each fed through its own cleaner as lines arrive"""
+    
+    def __init__(self, path_for: Callable[[str], str], pipeline: CleaningPipeline):
+        self.path_for = path_for
+        self.pipeline = pipeline
+        self.stats: Dict[str, DialogueStats] = {}
+        self.written: Dict[str, int] = {}
+        self.files: Dict[str, TextIO] = {}
+        self._cleaners: Dict[str, Callable[[str], Optional[str]]] = {}
+    
+    def add(self, line: CharacterLine):
+        """Count the line in its character's stats and write it"""
+        if line.character not in self.stats:
+            self.stats[line.character] = DialogueStats()
+        self.stats[line.character].add(line)
+        self.write(line)
+    
+    def write(self, line: CharacterLine):
+        character = line.character
+        if character not in self.files:
+            self.written[character] = 0
+            self.files[character] = open(self.path_for(character), 'w', encoding='utf-8')
+            self._cleaners[character] = self.pipeline.cleaner().clean_line
+        
+        cleaned = self._cleaners[character](line.line)
+        if cleaned:
+            self.files[character].write(f"{character}: {cleaned}\n")
+            self.written[character] += 1
+    
+    def close(self):
+        for f in self.files.values():
+            f.close()
+    
+    def __enter__(self) -> '_TrainingWriters':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+def _write_changed_characters(lines: Callable[[], Iterable[CharacterLine]], output_dir: str,
+                              pipeline: CleaningPipeline, manifest: Optional[StageManifest]) -> Dict[str, DialogueStats]:
+    """
+    Clean lines() into per-character files, skipping characters whose lines
+    hash the same as when their file was last written. Characters without a
+    manifest entry are written on the first pass; lines() is only iterated a
+    second time if a known character's lines changed.
+    """
+    path_for = lambda character: training_data_path(output_dir, character)
+    stats: Dict[str, DialogueStats] = {}
+    digests = {}
+    key = lambda character: f"character:{character}"
+    known = lambda character: manifest is not None and key(character) in manifest
+    
+    with _TrainingWriters(path_for, pipeline) as writers:
+        for line in lines():
+            character = line.character
+            if character not in stats:
+                stats[character] = DialogueStats()
+                digests[character] = hashlib.sha256()
+            stats[character].add(line)
+            digests[character].update(line.line.encode('utf-8') + b'\0')
+            if not known(character):
+                writers.write(line)
+    
+    unchanged = {}
+    if manifest is not None:
+        for character in stats:
+            if known(character):
+                data = manifest.current(key(character), digests[character].hexdigest())
+                if data is not None:
+                    unchanged[character] = data['lines']
+    
+    changed = {character for character in stats if known(character) and character not in unchanged}
+    with _TrainingWriters(path_for, pipeline) as rewrites:
+        if changed:
+            for line in lines():
+                if line.character in changed:
+                    rewrites.write(line)
+    
+    for character in stats:
+        filename = path_for(character)
+        if character in unchanged:
+            print(f"Unchanged: {unchanged[character]} lines for {character} in {filename}")
+            continue
+        written = rewrites.written[character] if character in changed else writers.written[character]
+        if manifest is not None:
+            manifest.record(key(character), digests[character].hexdigest(), [filename], {'lines': written})
+        print(f"Saved {written} lines for {character} to {filename}")
+    
+    if manifest is not None:
+        # Characters (and earlier shards) this run no longer produces
+        for path in manifest.prune(key(character) for character in stats):
+            print(f"Removed stale {path}")
+    return stats
+
+def write_training_data(character_lines: Dict[str, List[CharacterLine]], output_dir: str,
+                        pipeline: CleaningPipeline = DEFAULT_PIPELINE,
+                        manifest: Optional[StageManifest] = None) -> Dict[str, DialogueStats]:
+    """Clean extracted lines straight into per-character files, without formatted lists"""
+    os.makedirs(output_dir, exist_ok=True)
+    _clear_shards(output_dir)
+    
+    all_lines = lambda: (line for lines in character_lines.values() for line in lines)
+    return _write_changed_characters(all_lines, output_dir, pipeline, manifest)
 
 def save_training_data(training_data: Dict[str, List[str]], output_dir: str) -> None:
     """Save character-specific training data"""
     os.makedirs(output_dir, exist_ok=True)
+    _clear_shards(output_dir)
     
     for character, lines in training_data.items():
-        filename = f"{output_dir}/{character.lower()}_training_data.txt"
+        filename = training_data_path(output_dir, character)
         
         with open(filename, 'w', encoding='utf-8') as f:
             for line in lines:
@@ -137,10 +380,190 @@ def save_training_data(training_data: Dict[str, List[str]], output_dir: str) ->
         
         print(f"Saved {len(lines)} lines for {character} to {filename}")
 
+def stream_training_data(filepath: str, output_dir: str, pipeline: CleaningPipeline = DEFAULT_PIPELINE,
+                         manifest: Optional[StageManifest] = None) -> Dict[str, DialogueStats]:
+    """
+    Episodes -> character lines -> cleaned examples -> per-character files,
+    one line at a time. Produces the same files as the in-memory path.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    _clear_shards(output_dir)
+    
+    stats = _write_changed_characters(lambda: iter_character_lines(iter_episodes(filepath)),
+                                      output_dir, pipeline, manifest)
+    print_character_stats(stats)
+    return stats
+
+def _extract_shard(shard: int, episodes: List[Dict], output_dir: str,
+                   pipeline: CleaningPipeline) -> Tuple[Dict[str, DialogueStats], Dict[str, int]]:
+    """Worker: clean one shard of episodes into its own per-character files"""
+    with _TrainingWriters(lambda character: shard_path(output_dir, character, shard), pipeline) as writers:
+        for line in iter_character_lines(episodes):
+            writers.add(line)
+    return writers.stats, writers.written
+
+def _iter_shards(episodes: Iterable[Dict], shard_size: int) -> Iterator[List[Dict]]:
+    shard = []
+    for episode in episodes:
+        shard.append(episode)
+        if len(shard) == shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+def _shard_entry(shard_stats: Dict[str, DialogueStats], written: Dict[str, int]) -> Dict:
+    return {
+        'stats': {character: stats.to_dict() for character, stats in shard_stats.items()},
+        'written': written
+    }
+
+def parallel_training_data(filepath: str, output_dir: str, processes: int = None, shard_size: int = 16,
+                           merge: bool = False, pipeline: CleaningPipeline = DEFAULT_PIPELINE,
+                           manifest: Optional[StageManifest] = None) -> Dict[str, DialogueStats]:
+    """
+    Shard the corpus into runs of shard_size episodes and clean them on a
+    process pool. Shard files and stats are collected in shard order, so
+    reading each character's shards in manifest order gives exactly the
+    serial output; merge also concatenates them into the usual single files.
+    Pipelines with whole-stream stages (dedup) are rejected, since a shard
+    can't see the lines before it.
+    
+    With a build manifest, shards whose episodes hash the same as last time
+    are not resubmitted, and merged files are only rebuilt when the content
+    of their shards changed.
+    """
+    if pipeline.spans_stream:
+        raise ValueError(f"{pipeline} needs the whole stream; use serial or --stream extraction")
+    processes = processes or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    if manifest is None:
+        _clear_shards(output_dir)
+    os.makedirs(os.path.join(output_dir, SHARD_DIR), exist_ok=True)
+    
+    stats: Dict[str, DialogueStats] = {}
+    files: Dict[str, Dict] = {}
+    rebuilt = [0, 0]  # shards rebuilt, shards reused
+    
+    def collect(shard: int, digest: str, result):
+        if isinstance(result, dict):
+            entry = result
+            rebuilt[1] += 1
+        else:
+            entry = _shard_entry(*result.get())
+            rebuilt[0] += 1
+            if manifest is not None:
+                outputs = [shard_path(output_dir, character, shard) for character in entry['written']]
+                manifest.record(f"shard:{shard:05d}", digest, outputs, entry)
+        
+        for character, character_stats in entry['stats'].items():
+            if character not in stats:
+                stats[character] = DialogueStats()
+                files[character] = {'files': [], 'lines': 0}
+            stats[character].merge(DialogueStats.from_dict(character_stats))
+            files[character]['files'].append(os.path.relpath(shard_path(output_dir, character, shard), output_dir))
+            files[character]['lines'] += entry['written'][character]
+    
+    shard_keys = []
+    with multiprocessing.Pool(processes) as pool:
+        # Bounded window of shards in flight keeps memory flat on big corpora
+        pending = deque()
+        for shard, episodes in enumerate(_iter_shards(iter_episodes(filepath), shard_size)):
+            shard_keys.append(f"shard:{shard:05d}")
+            digest = digest_json(episodes)
+            reused = manifest.current(f"shard:{shard:05d}", digest) if manifest is not None else None
+            if reused is None:
+                reused = pool.apply_async(_extract_shard, (shard, episodes, output_dir, pipeline))
+            pending.append((shard, digest, reused))
+            if len(pending) >= 2 * processes:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+    
+    with open(os.path.join(output_dir, SHARD_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump({'shard_size': shard_size, 'characters': files}, f, indent=2)
+    
+    if manifest is not None:
+        # Shard files from a longer or differently-split previous run
+        listed = {name for entry in files.values() for name in entry['files']}
+        for name in os.listdir(os.path.join(output_dir, SHARD_DIR)):
+            if os.path.join(SHARD_DIR, name) not in listed:
+                os.remove(os.path.join(output_dir, SHARD_DIR, name))
+    
+    print_character_stats(stats)
+    print()
+    if manifest is not None:
+        print(f"Rebuilt {rebuilt[0]} shards, reused {rebuilt[1]}")
+    for character, entry in files.items():
+        if merge:
+            filename = training_data_path(output_dir, character)
+            merge_inputs = digest_files(os.path.join(output_dir, name) for name in entry['files'])
+            if manifest is not None and manifest.current(f"merged:{character}", merge_inputs) is not None:
+                print(f"Unchanged: {entry['lines']} lines for {character} in {filename}")
+                continue
+            with open(filename, 'wb') as out:
+                for name in entry['files']:
+                    with open(os.path.join(output_dir, name), 'rb') as shard_file:
+                        shutil.copyfileobj(shard_file, out)
+            if manifest is not None:
+                manifest.record(f"merged:{character}", merge_inputs, [filename])
+        else:
+            filename = f"{len(entry['files'])} shards in {output_dir}/{SHARD_DIR}"
+        print(f"Saved {entry['lines']} lines for {character} to {filename}")
+    
+    if manifest is not None:
+        # Shards past the end of a shorter corpus, and single files of
+        # characters (or a whole earlier layout) this run no longer produces
+        keep = shard_keys + ([f"merged:{character}" for character in files] if merge else [])
+        for path in manifest.prune(keep):
+            print(f"Removed stale {path}")
+    return stats
+
 def main():
+    parser = argparse.ArgumentParser(description="Extract BALLS character dialogue for LoRA training")
+    parser.add_argument("--input", default="the-office/the-office.json")
+    parser.add_argument("--output_dir", default="training_data")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream episodes one at a time (constant memory)")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Extract on N worker processes, writing per-shard files")
+    parser.add_argument("--shard_size", type=int, default=16, help="Episodes per shard")
+    parser.add_argument("--merge", action="store_true",
+                        help="With --processes, also merge shards into single per-character files")
+    parser.add_argument("--normalize_whitespace", action="store_true", help="Collapse runs of whitespace")
+    parser.add_argument("--dedup", action="store_true", help="Drop repeated lines per character (not with --processes)")
+    parser.add_argument("--min_chars", type=int, default=1, help="Drop cleaned lines shorter than this")
+    parser.add_argument("--max_chars", type=int, default=None, help="Drop cleaned lines longer than this")
+    parser.add_argument("--force", action="store_true", help="Ignore the build manifest and rewrite everything")
+    args = parser.parse_args()
+    if args.dedup and args.processes:
+        parser.error("--dedup needs every earlier line of a character, so it can't run with --processes")
+    
+    pipeline = build_pipeline(args.normalize_whitespace, args.dedup, args.min_chars, args.max_chars)
+    manifest = preprocess_manifest(args.output_dir, pipeline)
+    if args.force:
+        manifest.clear()
+    
+    if args.processes:
+        print(f"Extracting The Office dataset on {args.processes} processes...")
+        parallel_training_data(args.input, args.output_dir, args.processes, args.shard_size, args.merge,
+                               pipeline, manifest)
+        manifest.save()
+        print("\n=== PREPROCESSING COMPLETE ===")
+        print("Ready for LoRA training!")
+        return
+    
+    if args.stream:
+        print("Streaming The Office dataset...")
+        stream_training_data(args.input, args.output_dir, pipeline, manifest)
+        manifest.save()
+        print("\n=== PREPROCESSING COMPLETE ===")
+        print("Ready for LoRA training!")
+        return
+    
     # Load the data
     print("Loading The Office dataset...")
-    episodes = load_office_data('the-office/the-office.json')
+    episodes = load_office_data(args.input)
     print(f"Loaded {len(episodes)} episodes")
     
     # Extract character lines
@@ -150,13 +573,10 @@ def main():
     # Analyze the data
     analyze_character_data(character_lines)
     
-    # Format for training
-    print("\nFormatting for training...")
-    training_data = format_for_training(character_lines)
-    
-    # Save training data
+    # Clean and save training data
     print("\nSaving training data...")
-    save_training_data(training_data, 'training_data')
+    write_training_data(character_lines, args.output_dir, pipeline, manifest)
+    manifest.save()
     
     print("\n=== PREPROCESSING COMPLETE ===")
     print("Ready for LoRA training!")
@@ -4,7 +4,6 @@ Simple LoRA training script for Office characters
 Uses basic transformers + PEFT without heavy dependencies
 """
 
-import json
 import os
 import torch
 from transformers import (
@@ -15,16 +14,15 @@ from transformers import (
     DataCollatorForLanguageModeling
 )
 from peft import LoraConfig, get_peft_model, TaskType
-from datasets import Dataset
+from datasets import Dataset, load_dataset
 import argparse
 
-def load_character_data(character_file: str):
-    """Load JSONL training data for a character"""
-    data = []
-    with open(character_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            data.append(json.loads(line.strip()))
-    return data
+def load_character_data(character_file: str) -> Dataset:
+    """
+    Load JSONL training data for a character as a memory-mapped dataset;
+    the file is parsed in chunks into an Arrow cache, not into a Python list
+    """
+    return load_dataset("json", data_files=character_file, split="train")
 
 def format_training_text(example):
     """Format the conversation for training"""
@@ -83,10 +81,9 @@ def train_character_lora(character_name: str, data_file: str, output_dir: str):
     
     # Load and prepare data
     print(f"📊 Loading training data from {data_file}...")
-    raw_data = load_character_data(data_file)
+    dataset = load_character_data(data_file)
     
-    # Convert to dataset and format
-    dataset = Dataset.from_list(raw_data)
+    # Format
     dataset = dataset.map(format_training_text)
     
     # Tokenize
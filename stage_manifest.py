@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Incremental build manifests for the preprocessing stages
+Records what each unit of work (a character, a shard) was built from
+
+Each entry keeps a content hash of the unit's inputs and the sha256, size
+and mtime of every file it wrote. On a re-run a unit is skipped when its
+input hash is unchanged and its outputs are still on disk as written, so
+only characters or shards whose data changed are recomputed. The stage's
+parameters (cleaning stages, template source, ...) are hashed too; changing
+them invalidates every entry. Stale entries still remember their outputs,
+so prune() can delete the files of units a run no longer produces.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+def digest_bytes(*chunks: bytes) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def digest_json(value) -> str:
+    """Stable hash of a JSON-serializable value"""
+    return digest_bytes(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+def digest_file(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def digest_files(paths: Iterable[str]) -> str:
+    """One hash over several files, in order"""
+    return digest_json([digest_file(path) for path in paths])
+
+class StageManifest:
+    """Per-unit input hashes and output fingerprints for one pipeline stage"""
+
+    def __init__(self, path: str, stage: str, params):
+        self.path = path
+        self.root = os.path.dirname(path) or '.'
+        self.stage = stage
+        self.params = digest_json(params)
+        self.entries: Dict[str, Dict] = {}
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get('version') == MANIFEST_VERSION and saved.get('stage') == stage:
+            self.entries = saved.get('entries', {})
+            # Entries built with other parameters are all stale
+            if saved.get('params') != self.params:
+                self.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def current(self, key: str, inputs: str) -> Optional[Dict]:
+        """The entry's saved data if key was built from inputs and its outputs are intact, else None"""
+        entry = self.entries.get(key)
+        if entry is None or entry['inputs'] != inputs:
+            return None
+        if not all(self._output_intact(name, fingerprint) for name, fingerprint in entry['outputs'].items()):
+            return None
+        return entry.get('data', {})
+
+    def record(self, key: str, inputs: str, outputs: Sequence[str], data: Dict = None):
+        """Remember that outputs were just built from inputs"""
+        self.entries[key] = {
+            'inputs': inputs,
+            'outputs': {self._relative(path): self._fingerprint(path) for path in outputs},
+            'data': data or {}
+        }
+
+    def forget(self, key: str):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        """Mark every entry stale; their outputs stay known until rebuilt or pruned"""
+        for entry in self.entries.values():
+            entry['inputs'] = None
+    
+    def prune(self, keep: Iterable[str]) -> List[str]:
+        """
+        Drop entries whose key is not in keep and delete the files that only
+        they wrote; returns the deleted paths
+        """
+        keep = set(keep)
+        kept_outputs = {name for key, entry in self.entries.items() if key in keep for name in entry['outputs']}
+        removed = []
+        for key in [key for key in self.entries if key not in keep]:
+            for name in self.entries.pop(key)['outputs']:
+                path = os.path.join(self.root, name)
+                if name not in kept_outputs and os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+        return removed
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        # Write then rename, so an interrupted run never leaves a torn manifest
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'stage': self.stage,
+                'params': self.params,
+                'entries': self.entries
+            }, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root)
+
+    def _fingerprint(self, path: str) -> Dict:
+        stat = os.stat(path)
+        return {'sha256': digest_file(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _output_intact(self, name: str, fingerprint: Dict) -> bool:
+        path = os.path.join(self.root, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != fingerprint['size']:
+            return False
+        # Untouched since we wrote it; otherwise only the content decides
+        return stat.st_mtime_ns == fingerprint['mtime_ns'] or digest_file(path) == fingerprint['sha256']
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Seed validation on the meeting routes of both servers
+Run with: python -m pytest -q test_meeting_routes.py
+"""
+
+import asyncio
+
+import pytest
+
+import app as flask_app
+import asgi_app
+
+BAD_SEEDS = ['abc', '1.5', '-3', '']
+
+@pytest.mark.parametrize('seed', BAD_SEEDS)
+def test_flask_stream_meeting_rejects_bad_seed(seed):
+    response = flask_app.app.test_client().get('/api/stream_meeting', query_string={'seed': seed})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+def test_flask_stream_meeting_accepts_seed():
+    response = flask_app.app.test_client().get(
+        '/api/stream_meeting', query_string={'seed': '7', 'max_turns': '2'}
+    )
+    assert response.status_code == 200
+    assert 'event: analytics' in response.get_data(as_text=True)
+
+@pytest.mark.parametrize('seed', BAD_SEEDS)
+def test_quart_stream_meeting_rejects_bad_seed(seed):
+    async def request():
+        response = await asgi_app.app.test_client().get('/api/stream_meeting', query_string={'seed': seed})
+        return response.status_code, await response.get_json()
+
+    status, body = asyncio.run(request())
+    assert status == 400
+    assert body['success'] is False
+
+def test_quart_stream_meeting_accepts_seed():
+    async def request():
+        response = await asgi_app.app.test_client().get(
+            '/api/stream_meeting', query_string={'seed': '7', 'max_turns': '2'}
+        )
+        return response.status_code, await response.get_data(as_text=True)
+
+    status, body = asyncio.run(request())
+    assert status == 200
+    assert 'event: analytics' in body
@@ -4,22 +4,17 @@ Train individual character LoRAs using Unsloth
 Fast local training for Office character models
 """
 
-import json
 import argparse
 import os
-from datasets import Dataset
+from datasets import Dataset, load_dataset
 import torch
 from transformers import TrainingArguments
 from unsloth import FastLanguageModel
 from trl import SFTTrainer
 
-def load_character_data(character_file: str):
-    """Load JSONL training data for a character"""
-    data = []
-    with open(character_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            data.append(json.loads(line.strip()))
-    return data
+def load_character_data(character_file: str) -> Dataset:
+    """Load JSONL training data for a character (Arrow-backed, memory-mapped)"""
+    return load_dataset("json", data_files=character_file, split="train")
 
 def format_chat_template(example):
     """Format the conversation for training"""
@@ -61,10 +56,9 @@ def train_character_lora(character_name: str, data_file: str, output_dir: str):
     
     # Load and prepare data
     print(f"📊 Loading training data from {data_file}...")
-    raw_data = load_character_data(data_file)
+    dataset = load_character_data(data_file)
     
-    # Convert to dataset and format
-    dataset = Dataset.from_list(raw_data)
+    # Apply chat template
     dataset = dataset.map(format_chat_template)
     
     print(f"📈 Training dataset size: {len(dataset)} examples")